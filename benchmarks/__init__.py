@@ -0,0 +1,7 @@
+"""Benchmark suite for the pytest-loco-http package.
+
+This package contains performance benchmarks of the HTTP plugin hot
+paths: request execution overhead, response model building and
+serialization, URL and cookie model conversion, and URL joining.
+Benchmarks run against a local in-process HTTP server.
+"""
@@ -0,0 +1,120 @@
+"""Fixtures and hooks of the benchmark suite."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import pytest
+
+from pytest_loco_http.schema import CookieModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+OVERHEAD_GROUP = 'overhead'
+RAW_BENCHMARK = 'test_raw_request'
+PLUGIN_BENCHMARK = 'test_plugin_request'
+COLD_ROUNDS = 50
+
+
+class BenchmarkHandler(BaseHTTPRequestHandler):
+    """Request handler producing responses of configurable shape.
+
+    Query parameters:
+        size: Response body size in bytes.
+        headers: Number of extra response headers.
+        cookies: Number of cookies set by the response.
+        redirects: Number of redirects before the final response.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        """Respond to a GET request."""
+        url = urlsplit(self.path)
+        query = {key: int(value) for key, value in parse_qsl(url.query)}
+
+        if redirects := query.get('redirects', 0):
+            self.send_response(302)
+            self.send_header('location', f'{url.path}?{urlencode({**query, "redirects": redirects - 1})}')
+            self.send_header('content-length', '0')
+            self.end_headers()
+            return
+
+        body = b'x' * query.get('size', 0)
+
+        self.send_response(200)
+        self.send_header('content-type', 'application/octet-stream')
+        self.send_header('content-length', str(len(body)))
+        for index in range(query.get('headers', 0)):
+            self.send_header(f'x-benchmark-{index}', f'value-{index}')
+        for index in range(query.get('cookies', 0)):
+            self.send_header('set-cookie', f'cookie{index}=value{index}; Path=/; Max-Age=3600')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Suppress request logging."""
+
+
+@pytest.fixture(scope='session')
+def server() -> 'Iterator[str]':
+    """Run a local HTTP server for the benchmark session.
+
+    Yields:
+        Base URL of the server.
+    """
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), BenchmarkHandler)
+    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f'http://127.0.0.1:{httpd.server_port}/'
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture(params=['cold', 'warm'])
+def cookie_cache(request: pytest.FixtureRequest, benchmark: 'BenchmarkFixture') -> 'Callable[[Callable[[], Any]], Any]':
+    """Benchmark runner with a cold or warm cookie model cache.
+
+    Cold runs clear the cache before every round, so every cookie
+    model is built. Warm runs clear it once, so only the first round
+    builds models and the others measure cache lookups.
+
+    Returns:
+        A callable running the benchmark of a target.
+    """
+    CookieModel.from_fields.cache_clear()
+
+    if request.param == 'cold':
+        return lambda target: benchmark.pedantic(
+            target,
+            setup=CookieModel.from_fields.cache_clear,
+            rounds=COLD_ROUNDS,
+        )
+
+    return benchmark
+
+
+def pytest_benchmark_update_json(config: Any, benchmarks: Any, output_json: dict[str, Any]) -> None:  # noqa: ANN401, ARG001
+    """Report the plugin overhead per request in the JSON output.
+
+    The overhead is the difference between mean times of the plugin
+    request actor and a raw `requests` call to the same endpoint.
+    """
+    means = {
+        item['name']: item['stats']['mean']
+        for item in output_json['benchmarks']
+        if item['group'] == OVERHEAD_GROUP
+    }
+
+    if RAW_BENCHMARK in means and PLUGIN_BENCHMARK in means:
+        output_json['overhead'] = {
+            'mean': means[PLUGIN_BENCHMARK] - means[RAW_BENCHMARK],
+            'ratio': means[PLUGIN_BENCHMARK] / means[RAW_BENCHMARK],
+        }
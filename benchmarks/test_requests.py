@@ -0,0 +1,72 @@
+"""Benchmarks of request execution and response model building."""
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+import pytest
+import requests
+
+from pytest_loco_http.actions import request
+from pytest_loco_http.schema import ResponseModel
+from pytest_loco_http.user_agent import LOCO_USER_AGENT
+
+from .conftest import OVERHEAD_GROUP
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.mark.benchmark(group=OVERHEAD_GROUP)
+def test_raw_request(benchmark: 'BenchmarkFixture', server: str) -> None:
+    """Raw `requests` call used as the overhead baseline.
+
+    The session sends the same headers as plugin sessions.
+    """
+    with requests.Session() as session:
+        session.headers = {'user-agent': LOCO_USER_AGENT}
+        response = benchmark(session.request, 'GET', server)
+
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.benchmark(group=OVERHEAD_GROUP)
+def test_plugin_request(benchmark: 'BenchmarkFixture', server: str) -> None:
+    """Plugin request actor call to the same endpoint."""
+    result = benchmark(request, 'GET', {'session': 'benchmark', 'url': server})
+
+    assert result['status'] == HTTPStatus.OK
+
+
+@pytest.mark.benchmark(group='response-model')
+@pytest.mark.parametrize('shape', [
+    pytest.param({}, id='empty'),
+    pytest.param({'size': 1024}, id='body-1k'),
+    pytest.param({'size': 65536}, id='body-64k'),
+    pytest.param({'size': 1048576}, id='body-1m'),
+    pytest.param({'headers': 10}, id='headers-10'),
+    pytest.param({'headers': 90}, id='headers-90'),
+    pytest.param({'cookies': 10}, id='cookies-10'),
+    pytest.param({'cookies': 50}, id='cookies-50'),
+    pytest.param({'redirects': 1}, id='redirects-1'),
+    pytest.param({'redirects': 5}, id='redirects-5'),
+    pytest.param({'size': 65536, 'headers': 30, 'cookies': 30, 'redirects': 3}, id='mixed'),
+])
+def test_response_model(
+    cookie_cache: 'Callable[[Callable[[], Any]], Any]',
+    server: str,
+    shape: dict[str, int],
+) -> None:
+    """Response model building and serialization.
+
+    The response shape is controlled by body size, header count,
+    cookie count and redirect depth. Runs with a cold and a warm
+    cookie model cache.
+    """
+    response = requests.get(f'{server}?{urlencode(shape)}', timeout=10)
+
+    result = cookie_cache(lambda: ResponseModel.from_response(response).model_dump())
+
+    assert len(result['history']) == shape.get('redirects', 0)
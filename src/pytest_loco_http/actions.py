@@ -3,38 +3,52 @@
 This module defines generic HTTP actions for all HTTP methods.
 Each action delegates execution to a shared request function and
 returns a normalized ResponseModel dump.
+
+The `stream` action consumes streaming responses (Server-Sent Events,
+NDJSON, text lines or raw chunks) incrementally. The `share` action
+exports a named session state, so other processes can reuse the
+authenticated session, and the `restore` action imports it, reporting
+whether a valid state was found.
 """
 
 from functools import partial
 from http import HTTPMethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
+
+from requests import JSONDecodeError, Request
 
 from pytest_loco.extensions import Actor, Attribute, Schema
 from pytest_loco.values import Deferred, Value
 
+from .adapters import Engine
+from .encoding import Compression, accept_encoding, compress
+from .hooks import HookEvent, HookManager
 from .models import File, Url
-from .schema import FilesModel, ResponseModel
+from .schema import FilesModel, ProjectionModel, ResponseModel, StreamModel
+from .schema.projections import JSON_FIELD, project
 from .sessions import SessionManager
+from .streams import StreamFormat, consume
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from requests import Response, Session
+
 if TYPE_CHECKING:
     from pytest_loco.values import RuntimeValue
 
-def request(method: str, params: 'Mapping[str, RuntimeValue]') -> 'RuntimeValue':
-    """Execute an HTTP request using a managed session.
+def prepare(params: 'Mapping[str, RuntimeValue]') -> tuple['Session', dict[str, Any]]:
+    """Resolve the managed session and request arguments.
 
-    The function extracts supported request parameters, performs
-    an HTTP call via `requests.Session`, and returns a serialized
-    normalized response.
+    The function extracts supported request parameters, builds
+    multipart attachments, compresses the body if requested and
+    applies session-level settings (HTTP engine, accepted encodings).
 
     Args:
-        method: HTTP method to execute.
         params: Runtime-evaluated parameters for the request.
 
     Returns:
-        A serialized response.
+        The session to use and keyword arguments for `Session.request`.
     """
     payload = {
         key: value
@@ -53,19 +67,180 @@ def request(method: str, params: 'Mapping[str, RuntimeValue]') -> 'RuntimeValue'
         attachments = FilesModel.model_validate(files).to_requests()
         payload['files'] = attachments
 
-    response = (
-        SessionManager.get_session(params.get('session', 'default'))
-        .request(method, **payload)
+    if (encoding := params.get('compress')) and payload.get('data') is not None:
+        payload['data'] = compress(payload['data'], encoding)
+        payload['headers'] = {
+            **(payload.get('headers') or {}),
+            'content-encoding': encoding,
+        }
+
+    session = SessionManager.get_session(params.get('session', 'default'))
+    if engine := params.get('engine'):
+        SessionManager.set_engine(session, engine)
+    if encodings := params.get('acceptEncoding'):
+        session.headers['accept-encoding'] = accept_encoding(encodings)
+
+    return session, payload
+
+
+def send(
+    session: 'Session',
+    method: str,
+    payload: dict[str, Any],
+    *,
+    stream: bool = False,
+) -> 'Response':
+    """Send a request and emit its lifecycle events.
+
+    The function mirrors `Session.request`, emitting the pre-send
+    event before sending, the first-byte event once the response
+    headers are received and, unless streaming, the post-receive
+    event once the body is received.
+
+    Args:
+        session: The session to send the request with.
+        method: HTTP method to execute.
+        payload: Keyword arguments for `Session.request`.
+        stream: Whether to leave the response body unread.
+
+    Returns:
+        The received response.
+    """
+    arguments = dict(payload)
+    timeout = arguments.pop('timeout', None)
+    verify = arguments.pop('verify', None)
+
+    prepared = session.prepare_request(Request(method.upper(), **arguments))
+    HookManager.emit(HookEvent.PRE_SEND, request=prepared)
+
+    settings = session.merge_environment_settings(prepared.url, {}, True, verify, None)
+    response = session.send(prepared, timeout=timeout, allow_redirects=True, **settings)
+    HookManager.emit(HookEvent.FIRST_BYTE, response=response)
+
+    if not stream:
+        HookManager.emit(HookEvent.POST_RECEIVE, response=response, size=len(response.content))
+
+    return response
+
+
+def request(method: str, params: 'Mapping[str, RuntimeValue]') -> 'RuntimeValue':
+    """Execute an HTTP request using a managed session.
+
+    The function performs an HTTP call via `requests.Session`,
+    and returns a serialized normalized response. If a field
+    projection is given, only the selected fields are built
+    and returned.
+
+    Args:
+        method: HTTP method to execute.
+        params: Runtime-evaluated parameters for the request.
+
+    Returns:
+        A serialized response.
+    """
+    session, payload = prepare(params)
+    response = send(session, method, payload)
+
+    include = None
+    if select := params.get('select'):
+        include = ProjectionModel.model_validate(select).include
+
+    model = ResponseModel.from_response(response, include)
+    HookManager.emit(HookEvent.POST_MODEL_BUILD, response=response, model=model)
+
+    if include is None:
+        return model.model_dump()
+
+    subinclude = include.pop(JSON_FIELD, None)
+    result = model.model_dump(include=include)  # type: ignore[arg-type]
+
+    if subinclude is not None:
+        try:
+            result[JSON_FIELD] = project(response.json(), subinclude)
+        except JSONDecodeError:
+            result[JSON_FIELD] = None
+
+    return result
+
+
+def stream(params: 'Mapping[str, RuntimeValue]') -> 'RuntimeValue':
+    """Consume a streaming HTTP response using a managed session.
+
+    The function sends the request with a streaming body, collects
+    events as they arrive until a stop condition is met, and returns
+    a serialized stream with per-event arrival timestamps.
+
+    Args:
+        params: Runtime-evaluated parameters for the request.
+
+    Returns:
+        A serialized stream.
+    """
+    session, payload = prepare(params)
+
+    fmt = cast('StreamFormat', params.get('format') or 'sse')
+    if fmt == 'sse':
+        payload['headers'] = {
+            'accept': 'text/event-stream',
+            **(payload.get('headers') or {}),
+        }
+
+    if (duration := params.get('duration')) is not None:
+        timeout = payload.get('timeout')
+        payload['timeout'] = duration if timeout is None else min(timeout, duration)
+
+    response = send(session, params.get('method') or 'GET', payload, stream=True)
+    events, reason = consume(
+        response,
+        fmt,
+        count=params.get('count'),
+        duration=duration,
+        until=params.get('until'),
     )
+    HookManager.emit(HookEvent.POST_RECEIVE, response=response, size=None)
+
+    model = StreamModel.from_events(response, events, reason)
+    HookManager.emit(HookEvent.POST_MODEL_BUILD, response=response, model=model)
+
+    return model.model_dump()
+
+
+def share(params: 'Mapping[str, RuntimeValue]') -> 'RuntimeValue':
+    """Export a managed session state to the shared store.
+
+    Args:
+        params: Runtime-evaluated parameters for the export.
 
+    Returns:
+        A serialized session state.
+    """
     return (
-        ResponseModel
-        .from_response(response)
+        SessionManager
+        .export_state(params.get('session', 'default'))
         .model_dump()
     )
 
 
-request_parameters = Schema({
+def restore(params: 'Mapping[str, RuntimeValue]') -> 'RuntimeValue':
+    """Import a managed session state from the shared store.
+
+    The result reports whether a valid, non-expired state was
+    restored, so scenarios can fall back to the login flow.
+
+    Args:
+        params: Runtime-evaluated parameters for the import.
+
+    Returns:
+        A serialized session state with the `restored` flag.
+    """
+    name = params.get('session', 'default')
+    if (state := SessionManager.import_state(name)) is None:
+        return {'name': name, 'restored': False}
+
+    return {**state.model_dump(), 'restored': True}
+
+
+request_attributes = {
     'session': Attribute(
         base=str,
         default='default',
@@ -96,6 +271,31 @@ request_parameters = Schema({
         title='Request body',
         description='Optional request payload as raw bytes or string.',
     ),
+    'compress': Attribute(
+        base=Compression,
+        title='Request body compression',
+        description=(
+            'Optional content coding applied to the request body.\n'
+            'Sets the Content-Encoding header accordingly.'
+        ),
+    ),
+    'acceptEncoding': Attribute(
+        base=list[str] | str,
+        title='Accepted encodings',
+        description=(
+            'Content codings accepted for responses, in order of preference.\n'
+            'Applies to all subsequent requests of the session.'
+        ),
+    ),
+    'engine': Attribute(
+        base=Engine,
+        title='HTTP engine',
+        description=(
+            'HTTP engine of the session: `http1`, `http2` (negotiated over TLS)\n'
+            'or `h2c` (HTTP/2 with prior knowledge, also over cleartext).\n'
+            'Applies to all subsequent requests of the session.'
+        ),
+    ),
     'timeout': Attribute(
         base=int | float,
         title='Timeout',
@@ -108,6 +308,18 @@ request_parameters = Schema({
         title='Multipart files',
         description='Optional multipart file attachments.',
     ),
+    'select': Attribute(
+        base=ProjectionModel,
+        aliases=['include'],
+        default=None,
+        deferred=False,
+        title='Field projection',
+        description=(
+            'Optional list of response fields to materialize, '
+            'e.g. `status`, `headers.content-type` or `json`.\n'
+            'Other fields are neither built nor retained.'
+        ),
+    ),
     'verify': Attribute(
         base=bool | File,
         aliases=['sslVerify', 'caBundle'],
@@ -118,14 +330,93 @@ request_parameters = Schema({
             'Can be a boolean or a path to a CA bundle file.'
         ),
     ),
+}
+
+request_parameters = Schema(request_attributes)
+
+stream_parameters = Schema({
+    **{
+        name: attribute
+        for name, attribute in request_attributes.items()
+        if name != 'select'
+    },
+    'method': Attribute(
+        base=HTTPMethod,
+        default=HTTPMethod.GET,
+        title='HTTP method',
+        description='HTTP method of the streaming request.',
+    ),
+    'format': Attribute(
+        base=StreamFormat,
+        default='sse',
+        title='Stream format',
+        description=(
+            'How the response body is split into events:\n'
+            'Server-Sent Events, NDJSON lines, text lines or raw chunks.'
+        ),
+    ),
+    'count': Attribute(
+        base=int,
+        title='Event count',
+        description='Stop after receiving this number of events.',
+    ),
+    'duration': Attribute(
+        base=int | float,
+        title='Duration',
+        description=(
+            'Stop after this number of seconds since the request was sent.\n'
+            'Bounds the response timeout and every read of the stream.'
+        ),
+    ),
+    'until': Attribute(
+        base=str,
+        title='Stop pattern',
+        description='Stop after the first event matching this regular expression.',
+    ),
+})
+
+
+share_parameters = Schema({
+    'session': Attribute(
+        base=str,
+        default='default',
+        title='Session name',
+        description='Logical name of the HTTP session to export.',
+    ),
+})
+
+restore_parameters = Schema({
+    'session': Attribute(
+        base=str,
+        default='default',
+        title='Session name',
+        description='Logical name of the HTTP session to restore.',
+    ),
 })
 
 
 actors = [
+    *(
+        Actor(
+            actor=partial(request, method.name),
+            name=method.name.lower(),
+            parameters=request_parameters,
+        )
+        for method in HTTPMethod
+    ),
     Actor(
-        actor=partial(request, method.name),
-        name=method.name.lower(),
-        parameters=request_parameters,
-    )
-    for method in HTTPMethod
+        actor=stream,
+        name='stream',
+        parameters=stream_parameters,
+    ),
+    Actor(
+        actor=share,
+        name='share',
+        parameters=share_parameters,
+    ),
+    Actor(
+        actor=restore,
+        name='restore',
+        parameters=restore_parameters,
+    ),
 ]
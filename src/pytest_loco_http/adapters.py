@@ -0,0 +1,244 @@
+"""Transport adapters for HTTP sessions.
+
+This module provides `requests` transport adapters whose connections
+emit the `post-connect` lifecycle event once established: one for
+HTTP(S) over TCP and one for HTTP over Unix domain sockets. Unix
+socket URLs use the `http+unix` scheme with the percent-encoded socket
+path as the host, for example `http+unix://%2Frun%2Fapp.sock/health`.
+
+Sessions use these adapters with the default `http1` engine; the
+`http2` and `h2c` engines are provided by `pytest_loco_http.http2`.
+"""
+
+import socket
+import time
+from typing import TYPE_CHECKING, Any, Literal, cast
+from urllib.parse import unquote, urlsplit
+
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests.exceptions import InvalidURL
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.timeout import Timeout
+
+from .hooks import HookEvent, HookManager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from requests import PreparedRequest, Response
+
+Engine = Literal['http1', 'http2', 'h2c']
+
+UNIX_SCHEME = 'http+unix'
+
+
+def socket_path(url: str) -> str:
+    """Extract the socket path from an `http+unix` URL.
+
+    Args:
+        url: A URL with the percent-encoded socket path as the host.
+
+    Returns:
+        The decoded socket path.
+
+    Raises:
+        InvalidURL: If the URL has no socket path.
+    """
+    if not (path := unquote(urlsplit(url).netloc)):
+        raise InvalidURL(f'No socket path in URL {url!r}')
+
+    return path
+
+
+def http_version(response: 'Response') -> str:
+    """Get the protocol version of a response.
+
+    Args:
+        response: A Response instance.
+
+    Returns:
+        The protocol version, e.g. `HTTP/1.1`.
+    """
+    match getattr(response.raw, 'version', None):
+        case 10:
+            return 'HTTP/1.0'
+        case 20:
+            return 'HTTP/2'
+        case _:
+            return 'HTTP/1.1'
+
+
+class TracedHTTPConnection(HTTPConnection):
+    """HTTP connection emitting the post-connect event."""
+
+    def connect(self) -> None:
+        """Connect and emit the post-connect event."""
+        started = time.time_ns()
+        super().connect()
+        HookManager.emit(HookEvent.POST_CONNECT, host=self.host, port=self.port, started=started)
+
+
+class TracedHTTPSConnection(HTTPSConnection):
+    """HTTPS connection emitting the post-connect event.
+
+    The event is emitted after the TLS handshake.
+    """
+
+    def connect(self) -> None:
+        """Connect and emit the post-connect event."""
+        started = time.time_ns()
+        super().connect()
+        HookManager.emit(HookEvent.POST_CONNECT, host=self.host, port=self.port, started=started)
+
+
+class TracedHTTPConnectionPool(HTTPConnectionPool):
+    """Connection pool of traced HTTP connections."""
+
+    ConnectionCls = TracedHTTPConnection
+
+
+class TracedHTTPSConnectionPool(HTTPSConnectionPool):
+    """Connection pool of traced HTTPS connections."""
+
+    ConnectionCls = TracedHTTPSConnection
+
+
+class TracedAdapter(HTTPAdapter):
+    """Transport adapter for `http` and `https` URLs with traced connections."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pool manager with traced connection pools.
+
+        Args:
+            args: Positional parameters of the pool manager.
+            kwargs: Keyword parameters of the pool manager.
+        """
+        cast('Callable[..., None]', super().init_poolmanager)(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TracedHTTPConnectionPool,
+            'https': TracedHTTPSConnectionPool,
+        }
+
+
+class UnixHTTPConnection(TracedHTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, path: str, **kwargs: Any) -> None:
+        """Initialize the connection.
+
+        Args:
+            path: Path of the Unix domain socket.
+            kwargs: Connection parameters passed by the pool.
+        """
+        super().__init__('localhost', **kwargs)
+        self.socket_path = path
+
+    def _new_conn(self) -> socket.socket:
+        """Establish a socket connection to the Unix domain socket."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(Timeout.resolve_default_timeout(self.timeout))
+
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+
+        return sock
+
+
+class UnixHTTPConnectionPool(HTTPConnectionPool):
+    """Connection pool of a single Unix domain socket."""
+
+    def __init__(self, path: str, **kwargs: Any) -> None:
+        """Initialize the pool.
+
+        Args:
+            path: Path of the Unix domain socket.
+            kwargs: Pool parameters.
+        """
+        super().__init__('localhost', **kwargs)
+        self.socket_path = path
+
+    def _new_conn(self) -> HTTPConnection:
+        """Create a new connection to the Unix domain socket."""
+        self.num_connections += 1
+
+        return UnixHTTPConnection(
+            self.socket_path,
+            timeout=self.timeout.connect_timeout,
+        )
+
+
+class UnixAdapter(HTTPAdapter):
+    """Transport adapter for `http+unix` URLs.
+
+    Connection pools are created per socket path and reused
+    by subsequent requests to the same socket.
+    """
+
+    def __init__(self, pool_maxsize: int = DEFAULT_POOLSIZE, **kwargs: Any) -> None:
+        """Initialize the adapter.
+
+        Args:
+            pool_maxsize: Maximum number of connections kept per socket.
+            kwargs: Other parameters of `requests.adapters.HTTPAdapter`.
+        """
+        super().__init__(pool_maxsize=pool_maxsize, **kwargs)
+        self.pool_maxsize = pool_maxsize
+        self.pools: dict[str, UnixHTTPConnectionPool] = {}
+
+    def get_connection_with_tls_context(
+        self,
+        request: 'PreparedRequest',
+        verify: bool | str | None,
+        proxies: 'Mapping[str, str] | None' = None,
+        cert: tuple[str, str] | str | None = None,
+    ) -> UnixHTTPConnectionPool:
+        """Get the connection pool of the request socket.
+
+        Args:
+            request: The prepared request.
+            verify: Unused; Unix domain sockets have no TLS.
+            proxies: Proxies configured for the request.
+            cert: Unused; Unix domain sockets have no TLS.
+
+        Returns:
+            The connection pool of the socket.
+
+        Raises:
+            InvalidURL: If a proxy is configured for the URL.
+        """
+        del verify, cert
+
+        if proxies and proxies.get(UNIX_SCHEME):
+            raise InvalidURL(f'Proxies are not supported for {UNIX_SCHEME} URLs')
+
+        path = socket_path(request.url or '')
+        if path not in self.pools:
+            self.pools[path] = UnixHTTPConnectionPool(path, maxsize=self.pool_maxsize)
+
+        return self.pools[path]
+
+    def request_url(self, request: 'PreparedRequest', proxies: 'Mapping[str, str]') -> str:
+        """Get the request target sent to the socket.
+
+        Args:
+            request: The prepared request.
+            proxies: Unused; proxies are not supported.
+
+        Returns:
+            The path and query of the request URL.
+        """
+        del proxies
+
+        return request.path_url
+
+    def close(self) -> None:
+        """Close all connection pools."""
+        for pool in self.pools.values():
+            pool.close()
+
+        self.pools.clear()
+        cast('Callable[[], None]', super().close)()
@@ -0,0 +1,399 @@
+"""Capture of HTTP exchanges for failed tests.
+
+This module provides a pytest plugin object keeping the last N HTTP
+exchanges of the running test in a ring buffer of compact records.
+Bodies are not kept in memory: they are content-addressed and
+deduplicated in a per-run store on disk, and removed once no buffered
+exchange refers to them. When a test fails, its buffered exchanges are
+written out as a HAR file; for passing tests the buffer is discarded.
+Credentials in headers (authorization and cookies) are redacted.
+
+Capture is enabled by command line options registered in
+`pytest_loco_http.pytest_plugin`:
+
+- `--http-capture=N`: number of exchanges kept per test;
+- `--http-capture-dir=PATH`: directory of HAR files;
+- `--http-capture-secrets`: keep credentials in HAR files.
+"""
+
+import base64
+import hashlib
+import json
+import re
+import shutil
+from collections import Counter, deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from http import HTTPStatus
+from importlib.metadata import version
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from .adapters import http_version
+from .hooks import HookEvent, HookManager
+from .user_agent import LOCO_PLUGIN
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from requests import PreparedRequest, Response
+
+type Headers = tuple[tuple[str, str], ...]
+
+HAR_VERSION = '1.2'
+
+REDACTED = '**********'
+REDACTED_HEADERS = frozenset({'authorization', 'proxy-authorization', 'cookie', 'set-cookie'})
+
+
+class BodyStore:
+    """Content-addressed store of message bodies.
+
+    Bodies are stored once per SHA-256 digest, so identical bodies
+    of different exchanges share a single file. Stored bodies are
+    reference-counted and removed once the last reference is released.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Store directory.
+        """
+        self.root = root
+        self.references: Counter[str] = Counter()
+
+    def put(self, content: bytes) -> str:
+        """Store a body and take a reference to it.
+
+        Args:
+            content: The body content.
+
+        Returns:
+            The digest addressing the body.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        if digest not in self.references:
+            self.root.mkdir(parents=True, exist_ok=True)
+            (self.root / digest).write_bytes(content)
+
+        self.references[digest] += 1
+
+        return digest
+
+    def release(self, digest: str | None) -> None:
+        """Release a reference to a stored body.
+
+        The body is removed once it is no longer referenced.
+
+        Args:
+            digest: The digest addressing the body, or None.
+        """
+        if digest is None or digest not in self.references:
+            return
+
+        self.references[digest] -= 1
+        if self.references[digest] <= 0:
+            del self.references[digest]
+            (self.root / digest).unlink(missing_ok=True)
+
+    def get(self, digest: str) -> bytes:
+        """Load a stored body.
+
+        Args:
+            digest: The digest addressing the body.
+
+        Returns:
+            The body content.
+        """
+        return (self.root / digest).read_bytes()
+
+
+@dataclass(frozen=True, slots=True)
+class ExchangeRecord:
+    """Compact record of a captured HTTP exchange.
+
+    Headers are kept as tuples of pairs and bodies as digests
+    in the body store.
+    """
+
+    started: datetime
+    wait: float
+    receive: float
+    method: str
+    url: str
+    http_version: str
+    request_headers: Headers
+    request_body: str | None
+    request_size: int
+    status: int
+    response_headers: Headers
+    response_body: str | None
+    response_size: int
+
+    @classmethod
+    def from_response(
+        cls,
+        response: 'Response',
+        store: BodyStore,
+        started: float,
+        received: float | None = None,
+    ) -> 'ExchangeRecord':
+        """Create a record of a received response.
+
+        Args:
+            response: A Response instance.
+            store: Store of message bodies.
+            started: Time the request was sent at, in seconds since the epoch.
+            received: Time the response body was received at, in seconds
+                since the epoch, or None if the body was streamed and is
+                not available.
+
+        Returns:
+            A compact exchange record.
+        """
+        request: PreparedRequest = response.request
+
+        request_body = request.body
+        if isinstance(request_body, str):
+            request_body = request_body.encode()
+        if not isinstance(request_body, bytes):
+            request_body = None
+
+        response_body = response.content if received is not None else None
+
+        wait = response.elapsed.total_seconds()
+        received = received or started + wait
+
+        return cls(
+            started=datetime.fromtimestamp(started, tz=UTC),
+            wait=wait,
+            receive=max(received - started - wait, 0.0),
+            method=request.method or 'GET',
+            url=request.url or '',
+            http_version=http_version(response),
+            request_headers=tuple(request.headers.items()),
+            request_body=store.put(request_body) if request_body else None,
+            request_size=len(request_body or b''),
+            status=response.status_code,
+            response_headers=tuple(response.headers.items()),
+            response_body=store.put(response_body) if response_body else None,
+            response_size=len(response_body or b''),
+        )
+
+    def release(self, store: BodyStore) -> None:
+        """Release the stored bodies of the record.
+
+        Args:
+            store: Store of message bodies.
+        """
+        store.release(self.request_body)
+        store.release(self.response_body)
+
+    def to_har(self, store: BodyStore, *, redact: bool = True) -> dict[str, Any]:
+        """Convert the record into a HAR entry.
+
+        Args:
+            store: Store of message bodies.
+            redact: Whether to redact credentials in headers.
+
+        Returns:
+            A HAR 1.2 entry.
+        """
+        request_headers = {key.lower(): value for key, value in self.request_headers}
+        response_headers = {key.lower(): value for key, value in self.response_headers}
+
+        request: dict[str, Any] = {
+            'method': self.method,
+            'url': self.url,
+            'httpVersion': self.http_version,
+            'cookies': [],
+            'headers': har_headers(self.request_headers, redact=redact),
+            'queryString': [
+                {'name': name, 'value': value}
+                for name, value in parse_qsl(urlsplit(self.url).query, keep_blank_values=True)
+            ],
+            'headersSize': -1,
+            'bodySize': self.request_size,
+        }
+
+        if self.request_body:
+            request['postData'] = {
+                'mimeType': request_headers.get('content-type', ''),
+                'text': store.get(self.request_body).decode(errors='replace'),
+            }
+
+        content: dict[str, Any] = {
+            'size': self.response_size,
+            'mimeType': response_headers.get('content-type', ''),
+        }
+
+        if self.response_body:
+            body = store.get(self.response_body)
+            try:
+                content['text'] = body.decode()
+            except UnicodeDecodeError:
+                content['text'] = base64.b64encode(body).decode()
+                content['encoding'] = 'base64'
+
+        try:
+            reason = HTTPStatus(self.status).phrase
+        except ValueError:
+            reason = ''
+
+        return {
+            'startedDateTime': self.started.isoformat(),
+            'time': (self.wait + self.receive) * 1000,
+            'request': request,
+            'response': {
+                'status': self.status,
+                'statusText': reason,
+                'httpVersion': self.http_version,
+                'cookies': [],
+                'headers': har_headers(self.response_headers, redact=redact),
+                'content': content,
+                'redirectURL': response_headers.get('location', ''),
+                'headersSize': -1,
+                'bodySize': -1,
+            },
+            'cache': {},
+            'timings': {
+                'send': 0,
+                'wait': self.wait * 1000,
+                'receive': self.receive * 1000,
+            },
+        }
+
+
+def har_headers(headers: Headers, *, redact: bool = True) -> list[dict[str, str]]:
+    """Convert header pairs into HAR name-value objects.
+
+    Args:
+        headers: Header pairs.
+        redact: Whether to redact values of credential headers.
+
+    Returns:
+        A list of HAR header objects.
+    """
+    return [
+        {'name': name, 'value': REDACTED if redact and name.lower() in REDACTED_HEADERS else value}
+        for name, value in headers
+    ]
+
+
+class HttpCapture:
+    """Ring buffer of HTTP exchanges of the running test.
+
+    The capture subscribes to request lifecycle hooks, keeps the last
+    exchanges of the running test and writes them as HAR on failure.
+    """
+
+    def __init__(self, size: int, directory: Path, *, redact: bool = True) -> None:
+        """Initialize the capture.
+
+        Args:
+            size: Number of exchanges kept per test.
+            directory: Directory of HAR files.
+            redact: Whether to redact credentials in headers.
+        """
+        self.directory = directory
+        self.redact = redact
+        self.store = BodyStore(Path(mkdtemp(prefix='pytest-loco-http-')))
+        self.records: deque[ExchangeRecord] = deque(maxlen=size)
+        self.started: ContextVar[float | None] = ContextVar('started', default=None)
+
+    def record(self, event: HookEvent, payload: dict[str, Any]) -> None:
+        """Record a lifecycle event of an exchange.
+
+        Args:
+            event: The lifecycle event.
+            payload: The event payload.
+        """
+        timestamp = payload['timestamp'] / 1e9
+
+        if event == HookEvent.PRE_SEND:
+            self.started.set(timestamp)
+            return
+
+        response: Response = payload['response']
+        started = self.started.get() or timestamp
+
+        for hop in response.history:
+            self.append(ExchangeRecord.from_response(hop, self.store, started, started))
+
+        received = timestamp if payload.get('size') is not None else None
+        self.append(ExchangeRecord.from_response(response, self.store, started, received))
+
+    def append(self, record: ExchangeRecord) -> None:
+        """Buffer an exchange record, evicting the oldest one if full.
+
+        Args:
+            record: The exchange record.
+        """
+        if len(self.records) == self.records.maxlen:
+            self.records.popleft().release(self.store)
+
+        self.records.append(record)
+
+    def clear(self) -> None:
+        """Discard the buffered exchanges and their stored bodies."""
+        while self.records:
+            self.records.popleft().release(self.store)
+
+    def to_har(self) -> dict[str, Any]:
+        """Convert the buffered exchanges into a HAR document.
+
+        Returns:
+            A HAR 1.2 document.
+        """
+        return {
+            'log': {
+                'version': HAR_VERSION,
+                'creator': {'name': LOCO_PLUGIN, 'version': version(LOCO_PLUGIN)},
+                'pages': [],
+                'entries': [record.to_har(self.store, redact=self.redact) for record in self.records],
+            },
+        }
+
+    def write(self, nodeid: str) -> Path:
+        """Write the buffered exchanges of a test as a HAR file.
+
+        Args:
+            nodeid: The pytest node ID of the test.
+
+        Returns:
+            Path of the written HAR file.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = re.sub(r'[^\w.-]+', '_', nodeid).strip('_')
+        path = self.directory / f'{name}.har'
+        path.write_text(json.dumps(self.to_har(), indent=2))
+
+        return path
+
+    def pytest_runtest_setup(self) -> None:
+        """Discard exchanges of the previous test."""
+        self.clear()
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self, item: pytest.Item) -> 'Generator[None, pytest.TestReport, pytest.TestReport]':
+        """Write the captured exchanges of a failed test."""
+        report = yield
+        if report.failed and self.records:
+            path = self.write(item.nodeid)
+            report.sections.append(('Captured HTTP exchanges', str(path)))
+            self.clear()
+
+        return report
+
+    def pytest_unconfigure(self) -> None:
+        """Unsubscribe from lifecycle hooks and remove the body store."""
+        HookManager.unsubscribe(HookEvent.PRE_SEND, self.record)
+        HookManager.unsubscribe(HookEvent.POST_RECEIVE, self.record)
+        shutil.rmtree(self.store.root, ignore_errors=True)
+
@@ -0,0 +1,134 @@
+"""HTTP content encoding utilities.
+
+This module provides request body compression and discovery of the
+response decoders supported by the underlying urllib3 installation.
+Optional codecs (brotli, zstd) can be accepted only when the modules
+they require are importable.
+"""
+
+import gzip
+import zlib
+from collections.abc import Callable
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Literal, cast
+
+from urllib3.util.request import ACCEPT_ENCODING as URLLIB3_ACCEPT_ENCODING
+
+if TYPE_CHECKING:
+    from requests import Response
+
+Compression = Literal['gzip', 'deflate', 'zstd']
+type Compressor = Callable[[bytes], bytes]
+
+ZSTD_MODULES = ('compression.zstd', 'backports.zstd', 'zstandard')
+
+DECODERS = tuple(
+    name.strip()
+    for name in URLLIB3_ACCEPT_ENCODING.split(',')
+)
+
+
+def zstd_compressor() -> Compressor | None:
+    """Find an available zstd compression function.
+
+    Returns:
+        A zstd compression function or None if no zstd module is installed.
+    """
+    for name in ZSTD_MODULES:
+        try:
+            if find_spec(name) is None:
+                continue
+        except ModuleNotFoundError:
+            continue
+
+        return cast('Compressor', import_module(name).compress)
+
+    return None
+
+
+def compress(content: bytes | str, encoding: Compression) -> bytes:
+    """Compress a request body.
+
+    Args:
+        content: Raw body as bytes or string (encoded as UTF-8).
+        encoding: Content coding to apply.
+
+    Returns:
+        The compressed body.
+
+    Raises:
+        ValueError: If the content coding is not supported or its
+            codec is not installed.
+    """
+    if isinstance(content, str):
+        content = content.encode()
+
+    compressor: Compressor | None
+    match encoding:
+        case 'gzip':
+            compressor = gzip.compress
+        case 'deflate':
+            compressor = zlib.compress
+        case 'zstd':
+            compressor = zstd_compressor()
+        case _:
+            compressor = None
+
+    if compressor is None:
+        raise ValueError(f'Content encoding {encoding!r} is not available')
+
+    return compressor(content)
+
+
+def accept_encoding(encodings: list[str] | str) -> str:
+    """Build an Accept-Encoding header value.
+
+    Args:
+        encodings: Content codings in order of preference.
+
+    Returns:
+        The header value.
+
+    Raises:
+        ValueError: If a content coding cannot be decoded.
+    """
+    if isinstance(encodings, str):
+        encodings = [name.strip() for name in encodings.split(',')]
+
+    if unsupported := [
+        name for name in encodings
+        if name.split(';', 1)[0].strip() not in {*DECODERS, 'identity', '*'}
+    ]:
+        raise ValueError(f'Content encodings {unsupported!r} cannot be decoded')
+
+    return ', '.join(encodings)
+
+
+def wire_size(response: 'Response') -> int | None:
+    """Get the size of the response body as transferred.
+
+    The size is read from the raw urllib3 response, falling back to
+    the Content-Length header and to the decoded body length for
+    uncompressed responses.
+
+    Args:
+        response: A Response instance with consumed content.
+
+    Returns:
+        The number of body bytes received, if it can be determined.
+    """
+    tell = getattr(response.raw, 'tell', None)
+    if callable(tell) and (size := tell()) is not None:
+        return cast('int', size)
+
+    if length := response.headers.get('content-length'):
+        try:
+            return int(length)
+        except ValueError:
+            pass
+
+    if response.headers.get('content-encoding', 'identity') == 'identity':
+        return len(response.content)
+
+    return None
@@ -0,0 +1,85 @@
+"""Request lifecycle hooks.
+
+This module provides a registry of callbacks invoked at the steps of
+an HTTP exchange performed by the plugin actors. Extensions subscribe
+to lifecycle events to observe requests without patching `requests`.
+
+Events and their payload, in order of emission:
+
+- `pre-send`: `request` (the prepared request), before sending;
+- `post-connect`: `host`, `port` and `started` (the connection start
+  time), after a new connection is established;
+- `first-byte`: `response`, after the response headers are received;
+- `post-receive`: `response` and `size` (the decoded body size, None
+  for streams), after the response body is received;
+- `post-model-build`: `response` and `model`, after the response
+  model is built.
+
+Every payload also contains `timestamp`, the event time in nanoseconds
+since the epoch.
+"""
+
+import time
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any, ClassVar
+
+type Hook = Callable[['HookEvent', dict[str, Any]], None]
+
+
+class HookEvent(StrEnum):
+    """Steps of an HTTP exchange."""
+
+    PRE_SEND = 'pre-send'
+    POST_CONNECT = 'post-connect'
+    FIRST_BYTE = 'first-byte'
+    POST_RECEIVE = 'post-receive'
+    POST_MODEL_BUILD = 'post-model-build'
+
+
+class HookManager:
+    """Registry of request lifecycle hooks.
+
+    Hooks are called synchronously in order of subscription with the
+    event and its payload. A hook is subscribed to an event at most once.
+    """
+
+    _hooks: ClassVar[dict[HookEvent, list[Hook]]] = {}
+
+    @classmethod
+    def subscribe(cls, event: HookEvent, hook: Hook) -> None:
+        """Subscribe a hook to an event.
+
+        Args:
+            event: The lifecycle event.
+            hook: A callable receiving the event and its payload.
+        """
+        hooks = cls._hooks.setdefault(event, [])
+        if hook not in hooks:
+            hooks.append(hook)
+
+    @classmethod
+    def unsubscribe(cls, event: HookEvent, hook: Hook) -> None:
+        """Unsubscribe a hook from an event.
+
+        Args:
+            event: The lifecycle event.
+            hook: A previously subscribed callable.
+        """
+        if hook in (hooks := cls._hooks.get(event, [])):
+            hooks.remove(hook)
+
+    @classmethod
+    def emit(cls, event: HookEvent, **payload: Any) -> None:
+        """Call the hooks subscribed to an event.
+
+        Args:
+            event: The lifecycle event.
+            payload: Event-specific payload.
+        """
+        if not (hooks := cls._hooks.get(event)):
+            return
+
+        payload.setdefault('timestamp', time.time_ns())
+        for hook in tuple(hooks):
+            hook(event, payload)
@@ -0,0 +1,440 @@
+"""HTTP/2 transport adapter for HTTP sessions.
+
+This module provides a `requests` transport adapter sending requests
+with `httpx`, so concurrent requests of a session to the same origin
+are multiplexed over a single HTTP/2 connection. HTTP/2 is negotiated
+via ALPN over TLS; for cleartext local services the adapter can use
+HTTP/2 with prior knowledge (h2c).
+
+The adapter produces regular `requests.Response` objects, so redirects,
+cookies and response models work the same as with the default engine.
+It requires the `http2` extra:
+
+    pip install pytest-loco-http[http2]
+"""
+
+import ssl
+import threading
+import time
+from email.message import Message
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast, override
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout, ReadTimeout, SSLError
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers, select_proxy
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+
+from .hooks import HookEvent, HookManager
+
+try:
+    import h2  # noqa: F401
+    import httpx
+except ImportError as error:
+    raise ImportError(
+        'The HTTP/2 engine requires the http2 extra: '
+        'pip install pytest-loco-http[http2]',
+    ) from error
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+    from requests import PreparedRequest
+
+    from .adapters import Engine
+
+type Timeout = float | tuple[float | None, float | None] | None
+type Certificate = bytes | str | tuple[bytes | str, bytes | str] | None
+type ClientKey = tuple[bool | str, Certificate, str | None]
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+PROTOCOL_VERSIONS = {'HTTP/1.0': 10, 'HTTP/1.1': 11, 'HTTP/2': 20}
+
+
+def ssl_context(verify: bool | str, cert: Certificate = None) -> ssl.SSLContext:
+    """Create an SSL context matching `requests` verification settings.
+
+    Args:
+        verify: Whether to verify the server certificate,
+            or a path to a CA bundle file or directory.
+        cert: Client certificate file or a pair of certificate
+            and key files.
+
+    Returns:
+        A configured SSL context.
+    """
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        location = Path(DEFAULT_CA_BUNDLE_PATH if verify is True else verify)
+        if location.is_dir():
+            context = ssl.create_default_context(capath=location)
+        else:
+            context = ssl.create_default_context(cafile=location)
+
+    if isinstance(cert, bytes | str):
+        context.load_cert_chain(cert)
+    elif cert:
+        context.load_cert_chain(*cert)
+
+    return context
+
+
+def client_timeout(timeout: Timeout) -> dict[str, float | None]:
+    """Convert a `requests` timeout into an `httpx` timeout extension.
+
+    Args:
+        timeout: A total timeout or a pair of connect and read timeouts.
+
+    Returns:
+        Connect, read, write and pool timeouts.
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+
+    return httpx.Timeout(read, connect=connect).as_dict()
+
+
+def is_ssl_error(error: BaseException) -> bool:
+    """Check whether an error is caused by a failed TLS handshake.
+
+    Args:
+        error: A transport error.
+
+    Returns:
+        True if an SSL error is among the causes of the error.
+    """
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, ssl.SSLError):
+            return True
+        cause = cause.__cause__ or cause.__context__
+
+    return False
+
+
+class HTTP2Body:
+    """Raw body of an `httpx` response with the urllib3 reading interface.
+
+    The body is what `requests` and the plugin expect of `Response.raw`:
+    it can be read, streamed and read as it arrives, reports the number
+    of bytes received and the protocol version. Transport errors are
+    raised as their urllib3 counterparts.
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        """Initialize the body.
+
+        Args:
+            response: A streaming `httpx` response.
+        """
+        self.response = response
+        self.version = PROTOCOL_VERSIONS.get(response.http_version, 11)
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.buffer = b''
+        self.chunks: Iterator[bytes] | None = None
+
+        message = Message()
+        for key, value in response.headers.multi_items():
+            message[key] = value
+
+        # `requests` extracts cookies from the headers of the underlying
+        # `http.client` response, which has no counterpart in `httpx`.
+        self._original_response = SimpleNamespace(msg=message)
+
+    def iterate(self, decode_content: bool) -> 'Iterator[bytes]':
+        """Get the iterator of received body chunks.
+
+        Args:
+            decode_content: Whether to decode the content coding.
+
+        Returns:
+            An iterator of non-empty chunks as they are received.
+        """
+        if self.chunks is None:
+            source = self.response.iter_bytes() if decode_content else self.response.iter_raw()
+            self.chunks = self.translate(source)
+
+        return self.chunks
+
+    def translate(self, chunks: 'Iterator[bytes]') -> 'Iterator[bytes]':
+        """Raise transport errors of body chunks as urllib3 errors.
+
+        Args:
+            chunks: Chunks of the `httpx` response body.
+
+        Yields:
+            The same chunks.
+
+        Raises:
+            ReadTimeoutError: If reading the body timed out.
+            DecodeError: If the content coding cannot be decoded.
+            ProtocolError: If the connection failed.
+        """
+        try:
+            yield from chunks
+        except httpx.TimeoutException as error:
+            raise ReadTimeoutError(None, str(self.response.url), str(error)) from error  # type: ignore[arg-type]
+        except httpx.DecodingError as error:
+            raise DecodeError(str(error)) from error
+        except httpx.TransportError as error:
+            raise ProtocolError(str(error), error) from error
+
+    def read(self, amt: int | None = None, decode_content: bool = True) -> bytes:
+        """Read the body.
+
+        Args:
+            amt: Number of bytes to read, or None to read until the end.
+            decode_content: Whether to decode the content coding.
+
+        Returns:
+            Up to `amt` bytes of the body; fewer only at the end.
+        """
+        chunks = self.iterate(decode_content)
+        if amt is None:
+            data, self.buffer = self.buffer + b''.join(chunks), b''
+            return data
+
+        while len(self.buffer) < amt and (chunk := next(chunks, b'')):
+            self.buffer += chunk
+
+        data, self.buffer = self.buffer[:amt], self.buffer[amt:]
+
+        return data
+
+    def read1(self, amt: int | None = None, decode_content: bool = True) -> bytes:
+        """Read the body as soon as any part of it is received.
+
+        Args:
+            amt: Maximum number of bytes to read.
+            decode_content: Whether to decode the content coding.
+
+        Returns:
+            Up to `amt` bytes of the body; empty only at the end.
+        """
+        data = self.buffer or next(self.iterate(decode_content), b'')
+        if amt is None:
+            self.buffer = b''
+            return data
+
+        data, self.buffer = data[:amt], data[amt:]
+
+        return data
+
+    def stream(self, amt: int | None = 2 ** 16, decode_content: bool = True) -> 'Iterator[bytes]':
+        """Iterate the body.
+
+        Args:
+            amt: Size of chunks, or None to yield chunks as they are received.
+            decode_content: Whether to decode the content coding.
+
+        Yields:
+            Non-empty chunks of the body.
+        """
+        read = self.read if amt else self.read1
+        while data := read(amt, decode_content):
+            yield data
+
+    def tell(self) -> int:
+        """Get the number of body bytes received, before decoding."""
+        return self.response.num_bytes_downloaded
+
+    def close(self) -> None:
+        """Close the response."""
+        self.response.close()
+
+    def release_conn(self) -> None:
+        """Release the connection of the response."""
+        self.response.close()
+
+
+class HTTP2Adapter(BaseAdapter):
+    """Transport adapter for `http` and `https` URLs using HTTP/2.
+
+    One `httpx` client is kept per TLS and proxy configuration, and
+    requests of concurrent threads share its connections. Without
+    prior knowledge, HTTP/2 is used over TLS when the server supports
+    it and HTTP/1.1 otherwise; with prior knowledge, HTTP/2 is used
+    for all URLs, including cleartext `http` ones (h2c).
+    """
+
+    def __init__(self, *, prior_knowledge: bool = False) -> None:
+        """Initialize the adapter.
+
+        Args:
+            prior_knowledge: Whether to assume every server speaks HTTP/2.
+        """
+        super().__init__()
+        self.prior_knowledge = prior_knowledge
+        self.clients: dict[ClientKey, httpx.Client] = {}
+        self.lock = threading.Lock()
+
+    @property
+    def engine(self) -> 'Engine':
+        """Name of the HTTP engine of the adapter."""
+        return 'h2c' if self.prior_knowledge else 'http2'
+
+    def get_client(self, verify: bool | str, cert: Certificate, proxy: str | None) -> httpx.Client:
+        """Get the client of a TLS and proxy configuration.
+
+        Args:
+            verify: SSL verification setting.
+            cert: Client certificate.
+            proxy: Proxy URL, if any.
+
+        Returns:
+            A cached or newly created `httpx` client.
+        """
+        key = (verify, cert, proxy)
+        with self.lock:
+            if key not in self.clients:
+                self.clients[key] = httpx.Client(
+                    http1=not self.prior_knowledge,
+                    http2=True,
+                    verify=ssl_context(verify, cert),
+                    proxy=proxy,
+                    trust_env=False,
+                )
+
+            return self.clients[key]
+
+    @override
+    def send(
+        self,
+        request: 'PreparedRequest',
+        stream: bool = False,
+        timeout: Timeout = None,
+        verify: bool | str = True,
+        cert: Certificate = None,
+        proxies: 'Mapping[str, str] | None' = None,
+    ) -> Response:
+        """Send a prepared request.
+
+        The response body is left unread; `requests.Session` reads
+        it unless streaming.
+
+        Args:
+            request: The prepared request.
+            stream: Unused; the body is always streamed.
+            timeout: A total timeout or a pair of connect and read timeouts.
+            verify: SSL verification setting.
+            cert: Client certificate.
+            proxies: Proxies configured for the request.
+
+        Returns:
+            The received response.
+
+        Raises:
+            ConnectTimeout: If connecting timed out.
+            ReadTimeout: If waiting for the response timed out.
+            SSLError: If the TLS handshake failed.
+            ConnectionError: If the connection failed.
+        """
+        del stream
+
+        url = httpx.URL(request.url or '')
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode()
+
+        outgoing = httpx.Request(
+            request.method or 'GET',
+            url,
+            headers=list(request.headers.items()),
+            content=body,
+            extensions={
+                'timeout': client_timeout(timeout),
+                'trace': tracer(url),
+            },
+        )
+
+        client = self.get_client(verify, cert, select_proxy(request.url or '', proxies or {}))
+        try:
+            incoming = client.send(outgoing, stream=True)
+        except httpx.ConnectTimeout as error:
+            raise ConnectTimeout(error, request=request) from error
+        except httpx.TimeoutException as error:
+            raise ReadTimeout(error, request=request) from error
+        except httpx.ConnectError as error:
+            if is_ssl_error(error):
+                raise SSLError(error, request=request) from error
+            raise RequestsConnectionError(error, request=request) from error
+        except httpx.TransportError as error:
+            raise RequestsConnectionError(error, request=request) from error
+
+        return self.build_response(request, incoming)
+
+    def build_response(self, request: 'PreparedRequest', incoming: httpx.Response) -> Response:
+        """Build a `requests` response of an `httpx` response.
+
+        Args:
+            request: The prepared request.
+            incoming: A streaming `httpx` response.
+
+        Returns:
+            A response with an unread body.
+        """
+        response = Response()
+        response.status_code = incoming.status_code
+        response.headers = CaseInsensitiveDict(incoming.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = HTTP2Body(incoming)
+        response.reason = incoming.reason_phrase
+        response.url = request.url or ''
+        response.request = request
+        # Digest authentication resends through `connection.send`; stubs type it as HTTPAdapter.
+        response.connection = self  # type: ignore[assignment]
+
+        cast('Callable[..., None]', extract_cookies_to_jar)(response.cookies, request, response.raw)
+
+        return response
+
+    def close(self) -> None:
+        """Close all clients."""
+        with self.lock:
+            for client in self.clients.values():
+                client.close()
+
+            self.clients.clear()
+
+
+def tracer(url: httpx.URL) -> 'Callable[[str, dict[str, Any]], None]':
+    """Create a connection trace callback of a request.
+
+    The callback emits the post-connect event once a new connection
+    is established, after the TLS handshake for `https` URLs.
+
+    Args:
+        url: The request URL.
+
+    Returns:
+        A trace callback for the `httpx` trace extension.
+    """
+    started = time.time_ns()
+    connected = 'connection.start_tls.complete' if url.scheme == 'https' else 'connection.connect_tcp.complete'
+
+    def trace(name: str, info: dict[str, Any]) -> None:
+        nonlocal started
+        del info
+
+        if name == 'connection.connect_tcp.started':
+            started = time.time_ns()
+        elif name == connected:
+            HookManager.emit(
+                HookEvent.POST_CONNECT,
+                host=url.host,
+                port=url.port or DEFAULT_PORTS.get(url.scheme),
+                started=started,
+            )
+
+    return trace
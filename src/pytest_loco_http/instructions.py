@@ -2,11 +2,12 @@
 
 This module provides the `urljoin` instruction, which composes a URL
 at runtime by joining a base URL stored in the execution context with
-a postfix path defined in YAML.
+a postfix path defined in YAML. Base URLs of Unix domain sockets
+(`http+unix` scheme) are joined the same way as HTTP URLs.
 """
 
 from typing import TYPE_CHECKING
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
 import yaml
 
@@ -14,11 +15,38 @@ from pytest_loco.builtins.lookups import VariableLookup
 from pytest_loco.errors import DSLRuntimeError, DSLSchemaError
 from pytest_loco.extensions import Instruction
 
+from .adapters import UNIX_SCHEME
+
 if TYPE_CHECKING:
     from pytest_loco.schema import YAMLLoader, YAMLNode
     from pytest_loco.values import Deferred, RuntimeValue, Value
 
 
+def join(base: str, postfix: str) -> str:
+    """Join a base URL with a postfix.
+
+    The standard `urljoin` does not resolve relative references
+    against unknown schemes, so `http+unix` base URLs are joined
+    as HTTP URLs with the original scheme restored.
+
+    Args:
+        base: Base URL.
+        postfix: Relative or absolute URL reference.
+
+    Returns:
+        The joined URL.
+    """
+    parts = urlsplit(base)
+    if parts.scheme != UNIX_SCHEME:
+        return urljoin(base, postfix)
+
+    joined = urlsplit(urljoin(urlunsplit(parts._replace(scheme='http')), postfix))
+    if (joined.scheme, joined.netloc) == ('http', parts.netloc):
+        joined = joined._replace(scheme=UNIX_SCHEME)
+
+    return urlunsplit(joined)
+
+
 def urljoin_constructor(loader: 'YAMLLoader', node: 'YAMLNode') -> 'Deferred[RuntimeValue]':
     """Create a deferred URL join resolver from YAML node.
 
@@ -54,7 +82,7 @@ def urljoin_constructor(loader: 'YAMLLoader', node: 'YAMLNode') -> 'Deferred[Run
             return None
 
         try:
-            return urljoin(value, postfix)
+            return join(value, postfix)
         except Exception as base:
             raise DSLRuntimeError.from_yaml_node('bad urljoin arguments', node) from base
 
@@ -3,12 +3,12 @@
 from pathlib import Path
 from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, FilePath, HttpUrl, PlainSerializer
+from pydantic import AnyUrl, BaseModel, ConfigDict, FilePath, PlainSerializer, UrlConstraints
 
 
 def stringify(value: Any) -> str | Any:  # noqa: ANN401
     """Stringify value."""
-    if isinstance(value, (Path, HttpUrl)):
+    if isinstance(value, (Path, AnyUrl)):
         return str(value)
 
     return value
@@ -17,7 +17,15 @@ def stringify(value: Any) -> str | Any:  # noqa: ANN401
 Stringify = PlainSerializer(stringify, return_type=str)
 
 File = Annotated[FilePath, Stringify]
-Url = Annotated[HttpUrl, Stringify]
+Url = Annotated[
+    AnyUrl,
+    UrlConstraints(
+        max_length=2083,
+        allowed_schemes=['http', 'https', 'http+unix'],
+        host_required=True,
+    ),
+    Stringify,
+]
 
 
 class PluginModel(BaseModel):
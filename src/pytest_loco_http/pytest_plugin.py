@@ -0,0 +1,93 @@
+"""pytest integration of the HTTP plugin.
+
+This module is registered as a pytest plugin and configures the
+optional features of the HTTP plugin from pytest command line options
+and the environment. It also assigns the identifier of the test run
+isolating the shared session store, and removes the stored session
+states of the run once the pytest session ends.
+
+Other modules of the package are imported lazily from hooks, so that
+they are not imported before coverage measurement starts.
+"""
+
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+
+CAPTURE_PLUGIN = 'loco-http-capture'
+
+session_run_key = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register HTTP capture command line options."""
+    group = parser.getgroup('loco-http', 'HTTP support for pytest-loco')
+    group.addoption(
+        '--http-capture',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Keep the last N HTTP exchanges of each test and write them as HAR if it fails.',
+    )
+    group.addoption(
+        '--http-capture-dir',
+        type=Path,
+        default=Path('http-captures'),
+        metavar='PATH',
+        help='Directory of HAR files of failed tests (default: http-captures).',
+    )
+    group.addoption(
+        '--http-capture-secrets',
+        action='store_true',
+        default=False,
+        help='Keep authorization and cookie headers in HAR files instead of redacting them.',
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Assign the session store run and enable HTTP capture and tracing if requested.
+
+    The run identifier is set in the environment, so pytest-xdist
+    workers started later share the session store of the run.
+
+    Raises:
+        UsageError: If the trace exporter is misconfigured.
+    """
+    from .capture import HttpCapture  # noqa: PLC0415
+    from .hooks import HookEvent, HookManager  # noqa: PLC0415
+    from .storage import RUN_ENV  # noqa: PLC0415
+    from .tracing import install  # noqa: PLC0415
+
+    if not hasattr(config, 'workerinput') and RUN_ENV not in os.environ:
+        os.environ[RUN_ENV] = config.stash[session_run_key] = uuid.uuid4().hex
+
+    try:
+        install()
+    except ValueError as error:
+        raise pytest.UsageError(str(error)) from error
+
+    if (size := config.getoption('http_capture')) <= 0:
+        return
+
+    capture = HttpCapture(
+        size,
+        config.getoption('http_capture_dir'),
+        redact=not config.getoption('http_capture_secrets'),
+    )
+    HookManager.subscribe(HookEvent.PRE_SEND, capture.record)
+    HookManager.subscribe(HookEvent.POST_RECEIVE, capture.record)
+    config.pluginmanager.register(capture, CAPTURE_PLUGIN)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove stored session states of the run assigned by the plugin."""
+    from .storage import RUN_ENV, SessionStore  # noqa: PLC0415
+
+    if (run := config.stash.get(session_run_key, None)) is None:
+        return
+
+    SessionStore().clear()
+    if os.environ.get(RUN_ENV) == run:
+        del os.environ[RUN_ENV]
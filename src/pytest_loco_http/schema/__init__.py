@@ -8,14 +8,24 @@ from external libraries like `requests` or `http.cookiejar`.
 
 from .cookies import CookieModel
 from .files import FileModel, FilesModel
+from .projections import ProjectionModel
 from .requests import RequestModel, ResponseModel
+from .sessions import SessionStateModel, StoredCookieModel
+from .streams import EventModel, StreamModel
+from .traces import SpanModel
 from .urls import UrlModel
 
 __all__ = (
     'CookieModel',
+    'EventModel',
     'FileModel',
     'FilesModel',
+    'ProjectionModel',
     'RequestModel',
     'ResponseModel',
+    'SessionStateModel',
+    'SpanModel',
+    'StoredCookieModel',
+    'StreamModel',
     'UrlModel',
 )
@@ -1,9 +1,10 @@
 """HTTP cookie model."""
 
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
-from pydantic import Field, SecretStr
+from pydantic import AliasChoices, Field, SecretStr
 
 from pytest_loco_http.models import PluginModel
 
@@ -11,6 +12,10 @@ if TYPE_CHECKING:
     from http.cookiejar import Cookie
     from typing import Self
 
+type CookieFields = tuple[tuple[str, Any], ...]
+
+COOKIE_CACHE_SIZE = 1024
+
 
 class CookieModel(PluginModel):
     """Structured representation of an HTTP cookie.
@@ -89,7 +94,7 @@ class CookieModel(PluginModel):
 
     rest: dict[str, Any] = Field(
         default_factory=dict,
-        validation_alias='_rest',
+        validation_alias=AliasChoices('_rest', 'rest'),
         title='Additional attributes',
         description='Additional non-standard cookie attributes.',
     )
@@ -98,36 +103,81 @@ class CookieModel(PluginModel):
     def from_cookiejar_cookie(cls, cookie: 'Cookie') -> 'Self':
         """Create a CookieModel from a Cookie instance.
 
+        Models are cached by the cookie attributes, so a cookie
+        shared by the request, the response and its redirect history
+        is converted once and the same immutable model is reused.
+
         Args:
             cookie: A cookie instance from http.cookiejar.
 
         Returns:
             An immutable CookieModel instance.
         """
-        data: dict[str, Any] = {
-            key: getattr(cookie, key)
-            for key in (
-                'version',
-                'name',
-                'secure',
-                'discard',
-                'comment',
-                'comment_url',
-                '_rest',
-            )
-        }
-
-        if cookie.value is not None:
-            data.setdefault('value', SecretStr(cookie.value))
-
-        if cookie.domain_specified:
-            data.setdefault('domain', cookie.domain)
-        if cookie.port_specified:
-            data.setdefault('port', cookie.port)
-        if cookie.path_specified:
-            data.setdefault('path', cookie.path)
-
-        if cookie.expires is not None:
-            data.setdefault('expires', datetime.fromtimestamp(cookie.expires, tz=UTC))
+        return cls.from_fields(cookie_fields(cookie))
+
+    @classmethod
+    @lru_cache(maxsize=COOKIE_CACHE_SIZE)
+    def from_fields(cls, fields: CookieFields) -> 'Self':
+        """Create a CookieModel from raw cookie attributes.
+
+        Args:
+            fields: Pairs of field names and raw attribute values,
+                as returned by `cookie_fields`.
+
+        Returns:
+            An immutable CookieModel instance.
+        """
+        data = dict(fields)
+
+        if data['value'] is not None:
+            data['value'] = SecretStr(data['value'])
+        if data['expires'] is not None:
+            data['expires'] = datetime.fromtimestamp(data['expires'], tz=UTC)
+
+        data['rest'] = dict(data['rest'])
 
         return cls.model_validate(data)
+
+    def is_expired(self, moment: datetime | None = None) -> bool:
+        """Check whether the cookie is expired at the given moment.
+
+        Cookies without an expiration time never expire.
+
+        Args:
+            moment: Point in time to check against. Defaults to now.
+
+        Returns:
+            True if the cookie expiration time has passed.
+        """
+        if self.expires is None:
+            return False
+
+        return self.expires <= (moment or datetime.now(tz=UTC))
+
+
+def cookie_fields(cookie: 'Cookie') -> CookieFields:
+    """Extract the raw attributes of a cookie as a hashable key.
+
+    Attributes that are not specified by the cookie itself
+    (domain, port and path defaults) are left unset.
+
+    Args:
+        cookie: A cookie instance from http.cookiejar.
+
+    Returns:
+        Pairs of CookieModel field names and raw attribute values.
+    """
+    return (
+        ('version', cookie.version),
+        ('name', cookie.name),
+        ('value', cookie.value),
+        ('domain', cookie.domain if cookie.domain_specified else None),
+        ('port', cookie.port if cookie.port_specified else None),
+        ('path', cookie.path if cookie.path_specified else None),
+        ('secure', cookie.secure),
+        ('discard', cookie.discard),
+        ('expires', cookie.expires),
+        ('comment', cookie.comment),
+        ('comment_url', cookie.comment_url),
+        ('rest', tuple(sorted(getattr(cookie, '_rest', {}).items()))),
+    )
@@ -0,0 +1,109 @@
+"""Response field projection model."""
+
+from typing import Any
+
+from pydantic import ConfigDict, RootModel, field_validator
+
+type Include = dict[str | int, 'Include | bool']
+
+JSON_FIELD = 'json'
+ALL_ITEMS = '__all__'
+
+
+def segment_key(segment: str) -> str | int:
+    """Convert a path segment into a projection tree key.
+
+    Args:
+        segment: A single segment of a dot-separated path.
+
+    Returns:
+        A list index, the all-items marker or a field name.
+    """
+    if segment == '*':
+        return ALL_ITEMS
+
+    if segment.lstrip('-').isdigit():
+        return int(segment)
+
+    return segment
+
+
+def project(value: Any, include: 'Include | bool') -> Any:  # noqa: ANN401
+    """Keep only the selected parts of a plain value.
+
+    Args:
+        value: A plain value composed of dictionaries and lists.
+        include: Projection tree; `True` keeps the whole value.
+
+    Returns:
+        The projected value.
+    """
+    if include is True or not isinstance(include, dict):
+        return value
+
+    if isinstance(value, dict):
+        return {
+            name: project(value[name], subtree)
+            for key, subtree in include.items()
+            if (name := key if key in value else str(key)) in value
+        }
+
+    if isinstance(value, list):
+        if ALL_ITEMS in include:
+            return [project(item, include[ALL_ITEMS]) for item in value]
+
+        return [
+            project(value[index], subtree)
+            for index, subtree in include.items()
+            if isinstance(index, int) and -len(value) <= index < len(value)
+        ]
+
+    return value
+
+
+class ProjectionModel(RootModel[list[str]]):
+    """Selection of response fields to materialize.
+
+    Each item is a dot-separated path, e.g. `status`,
+    `headers.content-type` or `history.*.status`. Numeric
+    segments select list items and `*` selects every item.
+    The virtual `json` field holds the parsed JSON body.
+    """
+
+    model_config = ConfigDict(title='Projection')
+
+    @field_validator('root')
+    @classmethod
+    def validate_paths(cls, paths: list[str]) -> list[str]:
+        """Validate that every path has no empty segments."""
+        for path in paths:
+            if not all(path.split('.')):
+                raise ValueError(f'Invalid field path {path!r}')
+
+        return paths
+
+    @property
+    def include(self) -> Include:
+        """Projection tree of the selected paths.
+
+        Leaves are `True`; selecting a field together with its
+        subfield keeps the whole field.
+        """
+        tree: Include = {}
+
+        for path in self.root:
+            node = tree
+            *parents, leaf = (
+                segment_key(segment)
+                for segment in path.split('.')
+            )
+
+            for segment in parents:
+                child = node.setdefault(segment, {})
+                if child is True:
+                    break
+                node = child  # type: ignore[assignment]
+            else:
+                node[leaf] = True
+
+        return tree
@@ -6,9 +6,12 @@ from typing import TYPE_CHECKING, Any
 from pydantic import Field
 from requests import Request
 
+from pytest_loco_http.adapters import http_version
+from pytest_loco_http.encoding import wire_size
 from pytest_loco_http.models import PluginModel, Url
 
 from .cookies import CookieModel
+from .projections import ALL_ITEMS
 from .urls import UrlModel
 
 if TYPE_CHECKING:
@@ -17,6 +20,8 @@ if TYPE_CHECKING:
 if TYPE_CHECKING:
     from requests import PreparedRequest, Response
 
+    from .projections import Include
+
 
 class RequestModel(PluginModel):
     """Structured representation of an HTTP request.
@@ -33,7 +38,7 @@ class RequestModel(PluginModel):
     url_string: Url = Field(
         serialization_alias='urlString',
         title='Request URL',
-        description='The full request URL as a validated HttpUrl.',
+        description='The full request URL as a validated URL.',
     )
     url: UrlModel = Field(
         title='Parsed URL',
@@ -118,6 +123,12 @@ class ResponseModel(PluginModel):
         description='The HTTP status code of the response.',
     )
 
+    version: str = Field(
+        default='HTTP/1.1',
+        title='Protocol version',
+        description='The HTTP protocol version of the response, e.g. `HTTP/2`.',
+    )
+
     headers: dict[str, str] = Field(
         default_factory=dict,
         title='Headers',
@@ -142,7 +153,23 @@ class ResponseModel(PluginModel):
         description='The raw response body as text.',
     )
 
-    request: RequestModel = Field(
+    size: int = Field(
+        default=0,
+        ge=0,
+        title='Body size',
+        description='The size of the decoded response body in bytes.',
+    )
+
+    raw_size: int | None = Field(
+        default=None,
+        ge=0,
+        serialization_alias='rawSize',
+        title='Raw body size',
+        description='The size of the response body as transferred, before content decoding.',
+    )
+
+    request: RequestModel | None = Field(
+        default=None,
         title='Original request.',
         description='The HTTP request that resulted in this response.',
     )
@@ -154,38 +181,94 @@ class ResponseModel(PluginModel):
     )
 
     @classmethod
-    def from_response(cls, response: 'Response') -> 'Self':
+    def from_response(
+        cls,
+        response: 'Response',
+        include: 'Include | None' = None,
+        *,
+        history: bool = True,
+    ) -> 'Self':
         """Create a ResponseModel from a requests Response object.
 
+        When a projection is given, only the selected top-level fields
+        are built; the others keep their defaults.
+
+        Redirect hops are built without their own history: requests
+        lists each hop in its own history, so it would never end.
+
         Args:
             response: A Response instance.
+            include: Optional projection tree of the fields to build.
+            history: Whether to build the redirect history.
 
         Returns:
             A normalized ResponseModel instance.
         """
+        def selected(name: str) -> bool:
+            return include is None or name in include
+
         data: dict[str, Any] = {
             'status': HTTPStatus(response.status_code),
-            'request': RequestModel.from_request(response.request),
-            'headers': {
+        }
+
+        if selected('version'):
+            data.setdefault('version', http_version(response))
+
+        if selected('request'):
+            data.setdefault('request', RequestModel.from_request(response.request))
+
+        if selected('headers'):
+            data.setdefault('headers', {
                 key.lower(): value
                 for key, value in response.headers.items()
-            },
-        }
+            })
+
+        if selected('size'):
+            data.setdefault('size', len(response.content))
+        if selected('raw_size'):
+            data.setdefault('raw_size', wire_size(response))
 
         if response.content:
-            data.setdefault('body', response.content)
-            data.setdefault('text', response.text)
+            if selected('body'):
+                data.setdefault('body', response.content)
+            if selected('text'):
+                data.setdefault('text', response.text)
 
-        if response.cookies:
+        if response.cookies and selected('cookies'):
             data.setdefault('cookies', [
                 CookieModel.from_cookiejar_cookie(cookie)
                 for cookie in response.cookies
             ])
 
-        if response.history:
+        if history and response.history and selected('history'):
+            subinclude = cls.history_include(include)
             data.setdefault('history', [
-                cls.from_response(subresponse)
+                cls.from_response(subresponse, subinclude, history=False)
                 for subresponse in response.history
             ])
 
         return cls.model_validate(data)
+
+    @staticmethod
+    def history_include(include: 'Include | None') -> 'Include | None':
+        """Merge projections of redirect history items.
+
+        Args:
+            include: Projection tree of a response.
+
+        Returns:
+            Projection tree covering every selected history item,
+            or None if history items are selected entirely.
+        """
+        if include is None or not isinstance(items := include.get('history'), dict):
+            return None
+
+        merged: Include = {}
+        for key, subtree in items.items():
+            if not isinstance(key, int) and key != ALL_ITEMS:
+                continue
+            if not isinstance(subtree, dict):
+                return None
+            merged.update(subtree)
+
+        return merged
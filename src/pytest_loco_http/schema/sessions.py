@@ -0,0 +1,223 @@
+"""HTTP session state model."""
+
+from datetime import UTC, datetime
+from http.cookiejar import Cookie
+from typing import TYPE_CHECKING, Any
+
+from pydantic import Field, field_serializer
+
+from pytest_loco_http.models import PluginModel
+
+from .cookies import CookieModel
+
+if TYPE_CHECKING:
+    from typing import Self
+
+if TYPE_CHECKING:
+    from requests import Session
+
+
+class StoredCookieModel(CookieModel):
+    """Cookie of a session state with its exact cookie jar scope.
+
+    The public `domain`, `port` and `path` fields are only set when
+    the cookie specified them. A restored cookie must keep the scope
+    assigned by the cookie jar, e.g. the host of a host-only cookie,
+    otherwise it would be sent to every host.
+    """
+
+    scope_domain: str = Field(
+        serialization_alias='scopeDomain',
+        title='Scope domain',
+        description='The domain the cookie is sent to, as stored in the cookie jar.',
+    )
+
+    domain_specified: bool = Field(
+        default=False,
+        serialization_alias='domainSpecified',
+        title='Domain specified flag',
+        description='Indicates whether the domain was set by the cookie.',
+    )
+
+    domain_initial_dot: bool = Field(
+        default=False,
+        serialization_alias='domainInitialDot',
+        title='Domain initial dot flag',
+        description='Indicates whether the domain set by the cookie starts with a dot.',
+    )
+
+    scope_path: str = Field(
+        default='/',
+        serialization_alias='scopePath',
+        title='Scope path',
+        description='The URL path the cookie is sent to, as stored in the cookie jar.',
+    )
+
+    path_specified: bool = Field(
+        default=False,
+        serialization_alias='pathSpecified',
+        title='Path specified flag',
+        description='Indicates whether the path was set by the cookie.',
+    )
+
+    scope_port: str | None = Field(
+        default=None,
+        serialization_alias='scopePort',
+        title='Scope ports',
+        description='The ports the cookie is sent to, as stored in the cookie jar.',
+    )
+
+    port_specified: bool = Field(
+        default=False,
+        serialization_alias='portSpecified',
+        title='Port specified flag',
+        description='Indicates whether the ports were set by the cookie.',
+    )
+
+    @classmethod
+    def from_cookiejar_cookie(cls, cookie: 'Cookie') -> 'Self':
+        """Create a StoredCookieModel from a Cookie instance.
+
+        Args:
+            cookie: A cookie instance from http.cookiejar.
+
+        Returns:
+            An immutable StoredCookieModel instance.
+        """
+        return cls.model_validate({
+            **dict(CookieModel.from_cookiejar_cookie(cookie)),
+            'scope_domain': cookie.domain,
+            'domain_specified': cookie.domain_specified,
+            'domain_initial_dot': cookie.domain_initial_dot,
+            'scope_path': cookie.path,
+            'path_specified': cookie.path_specified,
+            'scope_port': cookie.port,
+            'port_specified': cookie.port_specified,
+        })
+
+    def to_cookiejar_cookie(self) -> 'Cookie':
+        """Convert the model back into a cookiejar Cookie instance.
+
+        The cookie jar scope is restored exactly.
+
+        Returns:
+            A cookie instance suitable for `http.cookiejar.CookieJar`.
+        """
+        return Cookie(
+            version=self.version,
+            name=self.name,
+            value=self.value.get_secret_value() if self.value is not None else None,
+            port=self.scope_port,
+            port_specified=self.port_specified,
+            domain=self.scope_domain,
+            domain_specified=self.domain_specified,
+            domain_initial_dot=self.domain_initial_dot,
+            path=self.scope_path,
+            path_specified=self.path_specified,
+            secure=self.secure,
+            expires=int(self.expires.timestamp()) if self.expires else None,
+            discard=self.discard,
+            comment=self.comment,
+            comment_url=self.comment_url,
+            rest=self.rest,
+        )
+
+
+class SessionStateModel(PluginModel):
+    """Structured representation of a shareable HTTP session state.
+
+    The model captures cookies and default headers of a session so
+    that another process can restore an authenticated session without
+    repeating the login flow.
+    """
+
+    name: str = Field(
+        title='Session name',
+        description='Logical name of the exported HTTP session.',
+    )
+
+    headers: dict[str, str] = Field(
+        default_factory=dict,
+        title='Headers',
+        description='Default session headers normalized to lowercase keys.',
+    )
+
+    cookies: list[StoredCookieModel] = Field(
+        default_factory=list,
+        title='Cookies',
+        description='List of cookies stored in the session cookie jar.',
+    )
+
+    created: datetime = Field(
+        default_factory=lambda: datetime.now(tz=UTC),
+        title='Creation time',
+        description='The moment the session state was exported.',
+    )
+
+    @property
+    def expires(self) -> datetime | None:
+        """Expiration time of the state.
+
+        The state expires together with its earliest expiring cookie.
+        Session cookies without an expiration time do not limit it.
+        """
+        return min(
+            (cookie.expires for cookie in self.cookies if cookie.expires),
+            default=None,
+        )
+
+    def is_expired(self, moment: datetime | None = None) -> bool:
+        """Check whether any cookie of the state is expired.
+
+        Args:
+            moment: Point in time to check against. Defaults to now.
+
+        Returns:
+            True if the state can no longer be restored.
+        """
+        return any(cookie.is_expired(moment) for cookie in self.cookies)
+
+    @field_serializer('cookies', when_used='json')
+    def reveal_cookies(self, cookies: list[StoredCookieModel]) -> list[dict[str, Any]]:
+        """Serialize cookies with their secret values for storage."""
+        return [
+            {
+                **cookie.model_dump(mode='json'),
+                'value': cookie.value.get_secret_value() if cookie.value else None,
+            }
+            for cookie in cookies
+        ]
+
+    @classmethod
+    def from_session(cls, name: str, session: 'Session') -> 'Self':
+        """Create a SessionStateModel from a requests Session object.
+
+        Args:
+            name: The logical name of the session.
+            session: A Session instance.
+
+        Returns:
+            A normalized SessionStateModel instance.
+        """
+        return cls.model_validate({
+            'name': name,
+            'headers': {
+                key.lower(): value
+                for key, value in session.headers.items()
+                if isinstance(value, str)
+            },
+            'cookies': [
+                StoredCookieModel.from_cookiejar_cookie(cookie)
+                for cookie in session.cookies
+            ],
+        })
+
+    def apply(self, session: 'Session') -> None:
+        """Restore the state into a requests Session object.
+
+        Args:
+            session: A Session instance to update.
+        """
+        session.headers.update(self.headers)
+        for cookie in self.cookies:
+            session.cookies.set_cookie(cookie.to_cookiejar_cookie())
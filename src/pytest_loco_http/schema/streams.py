@@ -0,0 +1,118 @@
+"""HTTP stream event models."""
+
+from datetime import UTC, datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from pydantic import Field
+
+from pytest_loco_http.models import PluginModel
+from pytest_loco_http.streams import StopReason
+
+if TYPE_CHECKING:
+    from typing import Self
+
+    from requests import Response
+
+
+class EventModel(PluginModel):
+    """Structured representation of a received stream event.
+
+    Depending on the stream format, an event is a Server-Sent Event,
+    a parsed NDJSON line, a text line or a raw body chunk.
+    """
+
+    data: Any = Field(
+        default=None,
+        title='Event data',
+        description=(
+            'The event payload: SSE data or text line as string, '
+            'parsed NDJSON value, or raw chunk as bytes.'
+        ),
+    )
+
+    event: str | None = Field(
+        default=None,
+        title='Event type',
+        description='The SSE event type, if specified.',
+    )
+
+    id: str | None = Field(
+        default=None,
+        title='Event ID',
+        description='The SSE event identifier, if specified.',
+    )
+
+    retry: int | None = Field(
+        default=None,
+        ge=0,
+        title='Reconnection time',
+        description='The SSE reconnection time in milliseconds, if specified.',
+    )
+
+    received: datetime = Field(
+        default_factory=lambda: datetime.now(tz=UTC),
+        title='Arrival time',
+        description='The moment the event was received.',
+    )
+
+    elapsed: float = Field(
+        ge=0,
+        title='Elapsed time',
+        description='Seconds between sending the request and receiving the event.',
+    )
+
+
+class StreamModel(PluginModel):
+    """Structured representation of a consumed HTTP stream.
+
+    The model holds the response status and headers, collected events
+    and the reason the consumption stopped.
+    """
+
+    status: HTTPStatus = Field(
+        title='HTTP status',
+        description='The HTTP status code of the response.',
+    )
+
+    headers: dict[str, str] = Field(
+        default_factory=dict,
+        title='Headers',
+        description='Response headers normalized to lowercase keys.',
+    )
+
+    events: list[EventModel] = Field(
+        default_factory=list,
+        title='Events',
+        description='Events collected in order of arrival.',
+    )
+
+    reason: StopReason = Field(
+        title='Stop reason',
+        description=(
+            'Why the consumption stopped: event count reached, '
+            'timeout expired, matching event received, or stream closed.'
+        ),
+    )
+
+    @classmethod
+    def from_events(cls, response: 'Response', events: list[dict[str, Any]], reason: StopReason) -> 'Self':
+        """Create a StreamModel from a consumed Response object.
+
+        Args:
+            response: A streaming Response instance.
+            events: Collected event fields.
+            reason: Why the consumption stopped.
+
+        Returns:
+            A normalized StreamModel instance.
+        """
+        return cls.model_validate({
+            'status': HTTPStatus(response.status_code),
+            'headers': {
+                key.lower(): value
+                for key, value in response.headers.items()
+            },
+            'events': events,
+            'reason': reason,
+        })
@@ -0,0 +1,135 @@
+"""Trace span model."""
+
+from typing import Any
+
+from pydantic import Field
+
+from pytest_loco_http.models import PluginModel
+
+type SpanAttribute = str | int | float | bool
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+
+
+class SpanModel(PluginModel):
+    """Structured representation of a trace span.
+
+    A span covers a timed step of an HTTP exchange. Spans of one
+    exchange share the trace ID and are nested by parent span ID.
+    """
+
+    name: str = Field(
+        title='Span name',
+        description='The name of the traced step.',
+    )
+
+    trace_id: str = Field(
+        pattern=r'^[0-9a-f]{32}$',
+        title='Trace ID',
+        description='The hex-encoded 16-byte trace identifier.',
+    )
+
+    span_id: str = Field(
+        pattern=r'^[0-9a-f]{16}$',
+        title='Span ID',
+        description='The hex-encoded 8-byte span identifier.',
+    )
+
+    parent_id: str | None = Field(
+        default=None,
+        pattern=r'^[0-9a-f]{16}$',
+        title='Parent span ID',
+        description='The identifier of the parent span, if any.',
+    )
+
+    start: int = Field(
+        ge=0,
+        title='Start time',
+        description='The span start time in nanoseconds since the epoch.',
+    )
+
+    end: int = Field(
+        ge=0,
+        title='End time',
+        description='The span end time in nanoseconds since the epoch.',
+    )
+
+    process: int = Field(
+        default=0,
+        title='Process ID',
+        description='The identifier of the process the span was recorded in.',
+    )
+
+    thread: int = Field(
+        default=0,
+        title='Thread ID',
+        description='The identifier of the thread the span was recorded in.',
+    )
+
+    attributes: dict[str, SpanAttribute] = Field(
+        default_factory=dict,
+        title='Attributes',
+        description='Additional span attributes.',
+    )
+
+    def to_chrome(self) -> dict[str, Any]:
+        """Convert the span into a Chrome trace complete event.
+
+        Returns:
+            A trace event with microsecond timestamps.
+        """
+        return {
+            'name': self.name,
+            'cat': 'http',
+            'ph': 'X',
+            'ts': self.start / 1000,
+            'dur': (self.end - self.start) / 1000,
+            'pid': self.process,
+            'tid': self.thread,
+            'args': self.attributes,
+        }
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Convert the span into an OTLP-JSON span.
+
+        Returns:
+            A span object of the OTLP-JSON encoding.
+        """
+        span: dict[str, Any] = {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': SPAN_KIND_INTERNAL if self.parent_id else SPAN_KIND_CLIENT,
+            'startTimeUnixNano': str(self.start),
+            'endTimeUnixNano': str(self.end),
+            'attributes': [
+                {'key': key, 'value': otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+        }
+
+        if self.parent_id:
+            span['parentSpanId'] = self.parent_id
+
+        return span
+
+
+def otlp_value(value: SpanAttribute) -> dict[str, Any]:
+    """Convert an attribute value into an OTLP-JSON any value.
+
+    Args:
+        value: A scalar attribute value.
+
+    Returns:
+        The typed value object.
+    """
+    match value:
+        case bool():
+            return {'boolValue': value}
+        case int():
+            return {'intValue': str(value)}
+        case float():
+            return {'doubleValue': value}
+        case _:
+            return {'stringValue': str(value)}
@@ -1,6 +1,7 @@
 """URL model for normalized HTTP URL representation."""
 
 from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import unquote, urlsplit
 
 from pydantic import Field, SecretStr
 from yarl import URL
@@ -15,12 +16,13 @@ class UrlModel(PluginModel):
     """Structured representation of an HTTP URL.
 
     The model extracts normalized URL components from a string and
-    represents them in structured form.
+    represents them in structured form. For `http+unix` URLs the host
+    component is the percent-encoded path of a Unix domain socket.
     """
 
-    scheme: Literal['http', 'https'] = Field(
+    scheme: Literal['http', 'https', 'http+unix'] = Field(
         title='URL scheme',
-        description='The URL scheme (http or https).',
+        description='The URL scheme (http, https or http+unix).',
     )
 
     user: str | None = Field(
@@ -48,6 +50,12 @@ class UrlModel(PluginModel):
         description='The network port of the URL.',
     )
 
+    socket: str | None = Field(
+        default=None,
+        title='Socket path',
+        description='The decoded Unix domain socket path of an http+unix URL.',
+    )
+
     path: str = Field(
         title='Path',
         description='The path component of the URL.',
@@ -95,6 +103,9 @@ class UrlModel(PluginModel):
             )
         }
 
+        if url.scheme == 'http+unix':
+            data.update(host=None, socket=unquote(urlsplit(value).netloc))
+
         if url.password:
             data.setdefault('password', SecretStr(url.password))
         if url.query_string:
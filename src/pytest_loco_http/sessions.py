@@ -3,14 +3,31 @@
 This module provides a centralized session manager responsible for
 creating and caching configured `requests.Session` instances.
 Sessions are identified by name and reused across the application.
+
+Session state can be exported to a local store shared between
+processes (e.g. pytest-xdist workers), so other processes restore
+an authenticated session lazily instead of repeating the login flow.
+
+Sessions send HTTP(S) requests over HTTP/1.1 by default and can be
+switched to an HTTP/2 engine multiplexing concurrent requests.
 """
 
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from requests import Session
 
+from .adapters import UNIX_SCHEME, TracedAdapter, UnixAdapter
+from .schema import SessionStateModel
+from .storage import SessionStore
 from .user_agent import LOCO_USER_AGENT
 
+if TYPE_CHECKING:
+    from requests.adapters import BaseAdapter
+
+    from .adapters import Engine
+
+HTTP_PREFIXES = ('http://', 'https://')
+
 
 class SessionManager:
     """Factory and registry for configured HTTP sessions.
@@ -20,30 +37,75 @@ class SessionManager:
     Subsequent calls with the same name return the cached instance.
 
     Sessions are initialized with a predefined User-Agent header.
+    A newly created session restores its state from the shared store
+    when another process has exported a non-expired state for it.
     """
 
     _sessions: ClassVar[dict[str, Session]] = {}
+    _store: ClassVar[SessionStore | None] = None
 
     @staticmethod
     def initialize() -> Session:
         """Create and configure a new HTTP session.
 
-        The session is initialized with the default User-Agent header.
+        The session is initialized with the default User-Agent header,
+        emits connection lifecycle events, and can send requests to
+        `http+unix` URLs. No Accept-Encoding header is sent unless
+        accepted encodings are configured for the session.
 
         Returns:
             A configured `requests.Session` instance.
         """
         session = Session()
-        session.headers = {'user-agent': LOCO_USER_AGENT}
+        session.headers = {
+            'user-agent': LOCO_USER_AGENT,
+        }
+        session.mount('http://', TracedAdapter())
+        session.mount('https://', TracedAdapter())
+        session.mount(f'{UNIX_SCHEME}://', UnixAdapter())
 
         return session
 
+    @staticmethod
+    def set_engine(session: Session, engine: 'Engine') -> None:
+        """Switch the HTTP engine of a session.
+
+        The `http1` engine sends requests with `urllib3` over HTTP/1.1.
+        The `http2` engine negotiates HTTP/2 over TLS and multiplexes
+        concurrent requests over a single connection per origin; the
+        `h2c` engine also uses HTTP/2 for cleartext URLs. Adapters of
+        the previous engine are closed.
+
+        Args:
+            session: A session created by `initialize`.
+            engine: Name of the HTTP engine.
+
+        Raises:
+            ImportError: If an HTTP/2 engine is requested without
+                the `http2` extra installed.
+        """
+        if getattr(session.get_adapter('https://'), 'engine', 'http1') == engine:
+            return
+
+        adapters: list[BaseAdapter]
+        if engine == 'http1':
+            adapters = [TracedAdapter() for _ in HTTP_PREFIXES]
+        else:
+            from .http2 import HTTP2Adapter  # noqa: PLC0415
+
+            adapters = [HTTP2Adapter(prior_knowledge=engine == 'h2c')] * len(HTTP_PREFIXES)
+
+        for prefix, adapter in zip(HTTP_PREFIXES, adapters, strict=True):
+            session.adapters[prefix].close()
+            session.mount(prefix, adapter)
+
     @classmethod
     def get_session(cls, name: str = 'default') -> Session:
         """Retrieve a named HTTP session.
 
         If a session with the specified name does not exist,
-        a new one is created and cached.
+        a new one is created, restored from the shared store
+        if possible, and cached.
 
         Args:
             name: The logical name of the session.
@@ -52,6 +114,57 @@ class SessionManager:
             A cached or newly created `requests.Session` instance.
         """
         if name not in cls._sessions:
-            cls._sessions[name] = cls.initialize()
+            session = cls.initialize()
+            if state := cls.get_store().load(name):
+                state.apply(session)
+
+            cls._sessions[name] = session
 
         return cls._sessions[name]
+
+    @classmethod
+    def get_store(cls) -> SessionStore:
+        """Retrieve the shared session state store.
+
+        Returns:
+            A lazily created `SessionStore` instance.
+        """
+        if cls._store is None:
+            cls._store = SessionStore()
+
+        return cls._store
+
+    @classmethod
+    def export_state(cls, name: str = 'default') -> SessionStateModel:
+        """Export a named session state to the shared store.
+
+        Args:
+            name: The logical name of the session.
+
+        Returns:
+            The exported session state.
+        """
+        state = SessionStateModel.from_session(name, cls.get_session(name))
+        cls.get_store().save(state)
+
+        return state
+
+    @classmethod
+    def import_state(cls, name: str = 'default') -> SessionStateModel | None:
+        """Import a named session state from the shared store.
+
+        Unlike the implicit restore on session creation, the state is
+        loaded on every call and applied to an existing session too.
+
+        Args:
+            name: The logical name of the session.
+
+        Returns:
+            The imported session state or None if no valid,
+            non-expired state is stored.
+        """
+        session = cls.get_session(name)
+        if state := cls.get_store().load(name):
+            state.apply(session)
+
+        return state
@@ -0,0 +1,198 @@
+"""Local storage for HTTP session state shared between processes.
+
+This module provides a file-based store used to share authenticated
+session state (cookies and default headers) between pytest-xdist
+workers. Every read and write is guarded by a lock file, and states
+are replaced atomically, so concurrent workers never observe
+partially written data.
+
+States contain cookie secrets, so the store directories are only
+accessible by the owner and the run directory is removed at the end
+of the pytest session.
+
+The store location is controlled by environment variables:
+
+- `LOCO_HTTP_SESSION_STORE`: root directory of the store (defaults
+  to a per-user `pytest-loco-http-of-<user>` directory in the system
+  temp dir);
+- `LOCO_HTTP_SESSION_RUN`: identifier of the current test run, set by
+  the pytest plugin and inherited by pytest-xdist workers; states are
+  isolated per run. Falls back to `PYTEST_XDIST_TESTRUNUID` and to the
+  process ID.
+"""
+
+import getpass
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import gettempdir
+from typing import TYPE_CHECKING
+
+from pydantic import ValidationError
+
+from .schema import SessionStateModel
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+STORE_ENV = 'LOCO_HTTP_SESSION_STORE'
+RUN_ENV = 'LOCO_HTTP_SESSION_RUN'
+XDIST_RUN_ENV = 'PYTEST_XDIST_TESTRUNUID'
+
+DIRECTORY_MODE = 0o700
+FILE_MODE = 0o600
+
+LOCK_TIMEOUT = 10.0
+LOCK_POLL_INTERVAL = 0.05
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float = LOCK_TIMEOUT) -> 'Iterator[None]':
+    """Acquire an exclusive lock file.
+
+    The lock is taken by atomically creating the lock file. A lock
+    older than the timeout is considered stale and is broken.
+
+    Args:
+        path: Path of the lock file.
+        timeout: Maximum time in seconds to wait for the lock.
+
+    Yields:
+        Nothing; the lock is held inside the context.
+
+    Raises:
+        TimeoutError: If the lock cannot be acquired in time.
+    """
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            descriptor = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, FILE_MODE)
+            break
+
+        except FileExistsError:
+            try:
+                if time.time() - path.stat().st_mtime > timeout:
+                    path.unlink(missing_ok=True)
+                    continue
+            except FileNotFoundError:
+                continue
+
+            if time.monotonic() > deadline:
+                raise TimeoutError(f'Lock {path} is not acquired in {timeout} seconds') from None
+
+            time.sleep(LOCK_POLL_INTERVAL)
+
+    try:
+        os.close(descriptor)
+        yield
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def default_root() -> Path:
+    """Get the default root directory of the store.
+
+    Returns:
+        A per-user directory in the system temp dir.
+    """
+    try:
+        user = getpass.getuser()
+    except (ImportError, KeyError, OSError):
+        user = 'unknown'
+
+    return Path(gettempdir()) / f'pytest-loco-http-of-{user}'
+
+
+class SessionStore:
+    """File-based store of exported HTTP session states.
+
+    Each session state is stored as a separate JSON document named
+    after the session. The store directory is isolated per test run.
+    """
+
+    def __init__(self, root: Path | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Store directory. Resolved from the environment if omitted.
+        """
+        if root is None:
+            run = os.environ.get(RUN_ENV) or os.environ.get(XDIST_RUN_ENV) or str(os.getpid())
+            root = Path(os.environ.get(STORE_ENV) or default_root()) / run
+
+        self.root = root
+
+    def path(self, name: str) -> Path:
+        """Get the path of a stored session state.
+
+        Args:
+            name: The logical name of the session.
+
+        Returns:
+            Path of the state document.
+        """
+        return self.root / f'{name}.json'
+
+    @contextmanager
+    def lock(self, name: str) -> 'Iterator[None]':
+        """Lock a stored session state.
+
+        Args:
+            name: The logical name of the session.
+
+        Yields:
+            Nothing; the state is locked inside the context.
+        """
+        self.root.parent.mkdir(mode=DIRECTORY_MODE, parents=True, exist_ok=True)
+        self.root.mkdir(mode=DIRECTORY_MODE, exist_ok=True)
+        self.root.chmod(DIRECTORY_MODE)
+
+        with file_lock(self.root / f'{name}.lock'):
+            yield
+
+    def save(self, state: SessionStateModel) -> None:
+        """Store a session state, replacing a previous one.
+
+        Args:
+            state: The session state to store.
+        """
+        path = self.path(state.name)
+        with self.lock(state.name):
+            temporary = path.with_suffix(f'.{os.getpid()}.tmp')
+            descriptor = os.open(temporary, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, FILE_MODE)
+            with os.fdopen(descriptor, 'w') as stream:
+                stream.write(state.model_dump_json())
+            temporary.replace(path)
+
+    def load(self, name: str) -> SessionStateModel | None:
+        """Load a stored session state.
+
+        Missing, malformed and expired states are ignored.
+
+        Args:
+            name: The logical name of the session.
+
+        Returns:
+            The stored session state or None if it is unavailable.
+        """
+        path = self.path(name)
+        if not path.exists():
+            return None
+
+        with self.lock(name):
+            try:
+                state = SessionStateModel.model_validate_json(path.read_bytes())
+            except (OSError, ValidationError):
+                return None
+
+        if state.is_expired():
+            return None
+
+        return state
+
+    def clear(self) -> None:
+        """Remove all stored session states of the run."""
+        shutil.rmtree(self.root, ignore_errors=True)
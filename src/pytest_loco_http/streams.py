@@ -0,0 +1,256 @@
+"""Incremental consumption of streaming HTTP responses.
+
+This module iterates the body of a streaming response as it arrives
+and splits it into events: Server-Sent Events, NDJSON lines, plain
+text lines or raw chunks. Consumption stops early on an event count,
+an overall duration or a matching event.
+"""
+
+import json
+import re
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Literal
+
+from requests import ConnectionError as RequestsConnectionError
+from urllib3.exceptions import ReadTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from socket import socket
+
+    from requests import Response
+
+StreamFormat = Literal['sse', 'ndjson', 'lines', 'chunks']
+StopReason = Literal['count', 'timeout', 'match', 'closed']
+
+
+def read_socket(response: 'Response') -> 'socket | None':
+    """Get the socket the response body is read from.
+
+    Args:
+        response: A streaming Response instance.
+
+    Returns:
+        The connection socket, or None if the body is not read
+        from a urllib3 connection.
+    """
+    connection = getattr(response.raw, 'connection', None)
+
+    return getattr(connection, 'sock', None)
+
+
+def iter_chunks(response: 'Response', deadline: float | None = None) -> 'Iterator[bytes]':
+    """Iterate decoded body chunks as soon as they are received.
+
+    If a deadline is given, every read is bounded by the time remaining
+    until it, so a silent stream does not block past the deadline.
+
+    Args:
+        response: A streaming Response instance.
+        deadline: Monotonic time consumption must stop at.
+
+    Yields:
+        Non-empty chunks of the decoded response body.
+
+    Raises:
+        ReadTimeoutError: If the deadline passes.
+    """
+    read1 = getattr(response.raw, 'read1', None)
+    if read1 is None:
+        yield from response.iter_content(chunk_size=None)
+        return
+
+    sock = read_socket(response)
+    timeout = sock.gettimeout() if sock is not None else None
+
+    while True:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ReadTimeoutError(None, response.url, 'Stream duration exceeded.')  # type: ignore[arg-type]
+            if sock is not None:
+                sock.settimeout(remaining if timeout is None else min(timeout, remaining))
+
+        if not (chunk := read1(decode_content=True)):
+            return
+
+        yield chunk
+
+
+def iter_lines(response: 'Response', deadline: float | None = None) -> 'Iterator[str]':
+    """Iterate text lines of the response body as they are completed.
+
+    Lines may be terminated by LF, CRLF or CR. A trailing CR is held
+    back until the next chunk, since it may start a CRLF split across
+    chunks.
+
+    Args:
+        response: A streaming Response instance.
+        deadline: Monotonic time consumption must stop at.
+
+    Yields:
+        Decoded lines without line terminators.
+    """
+    encoding = response.encoding or 'utf-8'
+    buffer = b''
+
+    for chunk in iter_chunks(response, deadline):
+        buffer += chunk
+        held = b'\r' if buffer.endswith(b'\r') else b''
+        *lines, buffer = re.split(rb'\r\n|\r|\n', buffer.removesuffix(held))
+        buffer += held
+        for line in lines:
+            yield line.decode(encoding, errors='replace')
+
+    if buffer:
+        yield buffer.removesuffix(b'\r').decode(encoding, errors='replace')
+
+
+def iter_sse(response: 'Response', deadline: float | None = None) -> 'Iterator[dict[str, Any]]':
+    """Iterate Server-Sent Events of the response body.
+
+    Events are parsed according to the HTML Living Standard: `data`
+    lines are joined with newlines, comments are skipped and events
+    without data are not dispatched.
+
+    Args:
+        response: A streaming Response instance.
+        deadline: Monotonic time consumption must stop at.
+
+    Yields:
+        Event fields as a mapping with `event`, `id`, `retry` and `data`.
+    """
+    event: dict[str, Any] = {}
+    data: list[str] = []
+
+    for line in iter_lines(response, deadline):
+        if not line:
+            if data:
+                yield {**event, 'data': '\n'.join(data)}
+            event, data = {}, []
+            continue
+
+        if line.startswith(':'):
+            continue
+
+        field, _, value = line.partition(':')
+        value = value.removeprefix(' ')
+
+        match field:
+            case 'data':
+                data.append(value)
+            case 'event':
+                event['event'] = value
+            case 'id' if '\0' not in value:
+                event['id'] = value
+            case 'retry' if value.isdigit():
+                event['retry'] = int(value)
+
+
+def iter_events(
+    response: 'Response',
+    fmt: StreamFormat,
+    deadline: float | None = None,
+) -> 'Iterator[dict[str, Any]]':
+    """Iterate events of the response body in the given format.
+
+    Args:
+        response: A streaming Response instance.
+        fmt: Stream format.
+        deadline: Monotonic time consumption must stop at.
+
+    Yields:
+        Event fields as a mapping; `raw` holds the matched text.
+    """
+    match fmt:
+        case 'sse':
+            for event in iter_sse(response, deadline):
+                yield {**event, 'raw': event['data']}
+        case 'ndjson':
+            for line in iter_lines(response, deadline):
+                if line.strip():
+                    yield {'data': json.loads(line), 'raw': line}
+        case 'lines':
+            for line in iter_lines(response, deadline):
+                yield {'data': line, 'raw': line}
+        case 'chunks':
+            for chunk in iter_chunks(response, deadline):
+                yield {'data': chunk, 'raw': chunk.decode(response.encoding or 'utf-8', errors='replace')}
+
+
+def is_read_timeout(error: Exception) -> bool:
+    """Check whether an error is caused by a read timeout.
+
+    Args:
+        error: An error raised while reading the response body.
+
+    Returns:
+        True if the error is a (wrapped) urllib3 read timeout.
+    """
+    if isinstance(error, ReadTimeoutError):
+        return True
+
+    return bool(error.args) and isinstance(error.args[0], ReadTimeoutError)
+
+
+def consume(
+    response: 'Response',
+    fmt: StreamFormat,
+    *,
+    count: int | None = None,
+    duration: float | None = None,
+    until: str | None = None,
+) -> tuple[list[dict[str, Any]], StopReason]:
+    """Collect events of a streaming response until a stop condition.
+
+    The response is closed once consumption stops. A read timeout
+    ends consumption the same way as the overall duration does; reads
+    are bounded by the duration, so a silent stream stops on time.
+
+    Args:
+        response: A streaming Response instance.
+        fmt: Stream format.
+        count: Maximum number of events to collect.
+        duration: Maximum consumption time in seconds since the request was sent.
+        until: Regular expression; stop after the first matching event.
+
+    Returns:
+        Collected events with arrival timestamps and the stop reason.
+    """
+    started = time.monotonic() - response.elapsed.total_seconds()
+    deadline = started + duration if duration is not None else None
+    pattern = re.compile(until) if until else None
+    events: list[dict[str, Any]] = []
+    reason: StopReason = 'closed'
+
+    try:
+        for event in iter_events(response, fmt, deadline):
+            elapsed = time.monotonic() - started
+            if duration is not None and elapsed > duration:
+                reason = 'timeout'
+                break
+
+            raw = event.pop('raw')
+            events.append({
+                **event,
+                'received': datetime.now(tz=UTC),
+                'elapsed': elapsed,
+            })
+
+            if pattern and pattern.search(raw):
+                reason = 'match'
+                break
+            if count is not None and len(events) >= count:
+                reason = 'count'
+                break
+
+    except (ReadTimeoutError, RequestsConnectionError) as error:
+        if not is_read_timeout(error):
+            raise
+        reason = 'timeout'
+
+    finally:
+        response.close()
+
+    return events, reason
@@ -0,0 +1,234 @@
+"""Trace span export of HTTP exchanges.
+
+This module provides an exporter subscribing to the request lifecycle
+hooks. It records one span per HTTP exchange with child spans for its
+steps (connecting, waiting for the first byte, receiving the body and
+building the response model), and writes them to a local file in the
+OTLP-JSON or Chrome trace format when the process exits.
+
+The exporter is enabled by environment variables:
+
+- `LOCO_HTTP_TRACE`: path of the trace file;
+- `LOCO_HTTP_TRACE_FORMAT`: `chrome` (default) or `otlp`.
+
+Under pytest-xdist the worker ID is appended to the file name.
+"""
+
+import atexit
+import json
+import os
+import secrets
+import threading
+from contextvars import ContextVar
+from importlib.metadata import version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from .hooks import HookEvent, HookManager
+from .schema import SpanModel
+from .user_agent import LOCO_PLUGIN
+
+if TYPE_CHECKING:
+    from typing import Self
+
+    from requests import PreparedRequest, Response
+
+TRACE_ENV = 'LOCO_HTTP_TRACE'
+TRACE_FORMAT_ENV = 'LOCO_HTTP_TRACE_FORMAT'
+WORKER_ENV = 'PYTEST_XDIST_WORKER'
+
+type TraceFormat = Literal['chrome', 'otlp']
+
+
+class TraceExporter:
+    """Exporter of HTTP exchange spans.
+
+    Lifecycle events of an exchange are collected in the current
+    context and turned into spans once the response model is built.
+    """
+
+    def __init__(self, path: Path, fmt: TraceFormat = 'chrome') -> None:
+        """Initialize the exporter.
+
+        Args:
+            path: Path of the trace file.
+            fmt: Trace file format.
+        """
+        self.path = path
+        self.format = fmt
+        self.spans: list[SpanModel] = []
+        self.lock = threading.Lock()
+        self.exchange: ContextVar[dict[str, Any] | None] = ContextVar('exchange', default=None)
+
+    @classmethod
+    def from_environment(cls) -> 'Self | None':
+        """Create an exporter configured by environment variables.
+
+        Returns:
+            A configured exporter or None if tracing is disabled.
+        """
+        if not (location := os.environ.get(TRACE_ENV)):
+            return None
+
+        path = Path(location)
+        if worker := os.environ.get(WORKER_ENV):
+            path = path.with_name(f'{path.stem}.{worker}{path.suffix}')
+
+        fmt = os.environ.get(TRACE_FORMAT_ENV, 'chrome')
+        if fmt not in {'chrome', 'otlp'}:
+            raise ValueError(f'Unknown trace format {fmt!r}')
+
+        return cls(path, fmt)  # type: ignore[arg-type]
+
+    def install(self) -> None:
+        """Subscribe to lifecycle events and write the trace on exit."""
+        for event in HookEvent:
+            HookManager.subscribe(event, self.record)
+
+        atexit.register(self.write)
+
+    def record(self, event: HookEvent, payload: dict[str, Any]) -> None:
+        """Record a lifecycle event of the current exchange.
+
+        Args:
+            event: The lifecycle event.
+            payload: The event payload.
+        """
+        if event == HookEvent.PRE_SEND:
+            self.exchange.set({'request': payload['request'], 'connects': []})
+
+        if (exchange := self.exchange.get()) is None:
+            return
+
+        if event == HookEvent.POST_CONNECT:
+            exchange['connects'].append(payload)
+            return
+
+        exchange[event] = payload['timestamp']
+        if event == HookEvent.FIRST_BYTE:
+            exchange['response'] = payload['response']
+
+        if event == HookEvent.POST_MODEL_BUILD:
+            self.exchange.set(None)
+            spans = self.build(exchange)
+            with self.lock:
+                self.spans.extend(spans)
+
+    def build(self, exchange: dict[str, Any]) -> list[SpanModel]:
+        """Build spans of a completed exchange.
+
+        Args:
+            exchange: Collected lifecycle events of the exchange.
+
+        Returns:
+            The exchange span followed by its step spans.
+        """
+        request: PreparedRequest = exchange['request']
+        response: Response | None = exchange.get('response')
+
+        started = exchange[HookEvent.PRE_SEND]
+        first_byte = exchange.get(HookEvent.FIRST_BYTE, started)
+        received = exchange.get(HookEvent.POST_RECEIVE, first_byte)
+        built = exchange[HookEvent.POST_MODEL_BUILD]
+
+        common = {
+            'trace_id': secrets.token_hex(16),
+            'process': os.getpid(),
+            'thread': threading.get_ident(),
+        }
+
+        attributes: dict[str, Any] = {
+            'http.request.method': request.method or '',
+            'url.full': request.url or '',
+        }
+        if response is not None:
+            attributes['http.response.status_code'] = response.status_code
+
+        root = SpanModel.model_validate({
+            **common,
+            'name': f'HTTP {request.method}',
+            'span_id': secrets.token_hex(8),
+            'start': started,
+            'end': built,
+            'attributes': attributes,
+        })
+
+        steps: list[tuple[str, int, int, dict[str, Any]]] = [
+            (
+                'connect',
+                connect['started'],
+                connect['timestamp'],
+                {'server.address': connect['host'], 'server.port': connect['port'] or 0},
+            )
+            for connect in exchange['connects']
+        ]
+        steps.extend((
+            ('wait', started, first_byte, {}),
+            ('receive', first_byte, received, {}),
+            ('build', received, built, {}),
+        ))
+
+        return [root, *(
+            SpanModel.model_validate({
+                **common,
+                'name': name,
+                'span_id': secrets.token_hex(8),
+                'parent_id': root.span_id,
+                'start': start,
+                'end': max(start, end),
+                'attributes': extra,
+            })
+            for name, start, end, extra in steps
+        )]
+
+    def dump(self) -> dict[str, Any]:
+        """Serialize the recorded spans in the configured format.
+
+        Returns:
+            The trace document.
+        """
+        with self.lock:
+            spans = list(self.spans)
+
+        if self.format == 'chrome':
+            return {
+                'traceEvents': [span.to_chrome() for span in spans],
+                'displayTimeUnit': 'ms',
+            }
+
+        return {
+            'resourceSpans': [{
+                'resource': {
+                    'attributes': [
+                        {'key': 'service.name', 'value': {'stringValue': LOCO_PLUGIN}},
+                        {'key': 'process.pid', 'value': {'intValue': str(os.getpid())}},
+                    ],
+                },
+                'scopeSpans': [{
+                    'scope': {'name': LOCO_PLUGIN, 'version': version(LOCO_PLUGIN)},
+                    'spans': [span.to_otlp() for span in spans],
+                }],
+            }],
+        }
+
+    def write(self) -> None:
+        """Write the recorded spans to the trace file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.dump()))
+
+
+def install() -> TraceExporter | None:
+    """Install a trace exporter configured by environment variables.
+
+    Called by the pytest plugin once the pytest session is configured.
+
+    Returns:
+        The installed exporter or None if tracing is disabled.
+
+    Raises:
+        ValueError: If the trace format is unknown.
+    """
+    if exporter := TraceExporter.from_environment():
+        exporter.install()
+
+    return exporter
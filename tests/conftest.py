@@ -0,0 +1,167 @@
+"""Fixtures of the test suite."""
+
+import base64
+import gzip
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingUnixStreamServer
+from threading import Thread
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, quote, urlsplit
+
+import pytest
+
+from pytest_loco_http.hooks import HookManager
+from pytest_loco_http.sessions import SessionManager
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+pytest_plugins = ['pytester']
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Request handler of the local test server.
+
+    Paths:
+        /echo: Respond with the request method, path, headers and
+            base64-encoded body as JSON.
+        /cookies/set: Set host-only cookies from query parameters.
+        /status/<code>: Respond with the given status.
+        /redirect/<count>: Redirect `count` times before reaching /echo.
+        /silent: Send response headers and no body until `seconds`
+            (query parameter) elapse.
+        /events: Stream `count` (query parameter) Server-Sent Events,
+            one chunk per event.
+        /gzip: Respond with the echoed request as gzip-encoded JSON.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        """Respond to a GET request."""
+        self.respond()
+
+    def do_HEAD(self) -> None:
+        """Respond to a HEAD request without a body."""
+        self.respond()
+
+    def do_POST(self) -> None:
+        """Respond to a POST request."""
+        self.respond()
+
+    def respond(self) -> None:
+        """Dispatch the request by path."""
+        url = urlsplit(self.path)
+        query = dict(parse_qsl(url.query))
+        body = self.rfile.read(int(self.headers.get('content-length') or 0))
+
+        if url.path == '/silent':
+            self.send_response(200)
+            self.send_header('content-type', 'text/event-stream')
+            self.send_header('transfer-encoding', 'chunked')
+            self.end_headers()
+            time.sleep(float(query.get('seconds', 5)))
+            self.wfile.write(b'0\r\n\r\n')
+            return
+
+        if url.path == '/events':
+            self.send_response(200)
+            self.send_header('content-type', 'text/event-stream')
+            self.send_header('transfer-encoding', 'chunked')
+            self.end_headers()
+            for index in range(int(query.get('count', 3))):
+                event = f'id: {index}\r\ndata: {{"index": {index}}}\r\n\r\n'.encode()
+                self.wfile.write(f'{len(event):x}\r\n'.encode() + event + b'\r\n')
+            self.wfile.write(b'0\r\n\r\n')
+            return
+
+        if url.path.startswith('/redirect/'):
+            count = int(url.path.removeprefix('/redirect/'))
+            self.send_response(302)
+            self.send_header('location', f'/redirect/{count - 1}' if count > 1 else '/echo')
+            self.send_header('content-length', '0')
+            self.end_headers()
+            return
+
+        status = int(url.path.removeprefix('/status/')) if url.path.startswith('/status/') else 200
+        content = json.dumps({
+            'method': self.command,
+            'path': self.path,
+            'headers': {key.lower(): value for key, value in self.headers.items()},
+            'body': base64.b64encode(body).decode(),
+        }).encode()
+
+        self.send_response(status)
+        self.send_header('content-type', 'application/json')
+        if url.path == '/gzip':
+            content = gzip.compress(content)
+            self.send_header('content-encoding', 'gzip')
+        self.send_header('content-length', str(len(content)))
+        if url.path == '/cookies/set':
+            for name, value in query.items():
+                self.send_header('set-cookie', f'{name}={value}; Path=/')
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(content)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Suppress request logging."""
+
+
+@pytest.fixture(scope='session')
+def server() -> 'Iterator[str]':
+    """Run a local HTTP server for the test session.
+
+    Yields:
+        Base URL of the server.
+    """
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), EchoHandler)
+    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f'http://127.0.0.1:{httpd.server_port}/'
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+class UnixEchoServer(ThreadingUnixStreamServer):
+    """Local HTTP server on a Unix domain socket."""
+
+    daemon_threads = True
+
+
+@pytest.fixture(scope='session')
+def unix_server(tmp_path_factory: pytest.TempPathFactory) -> 'Iterator[str]':
+    """Run a local HTTP server on a Unix domain socket for the test session.
+
+    The socket path contains a space, so it is percent-encoded in the URL.
+
+    Yields:
+        Base `http+unix` URL of the server.
+    """
+    path = tmp_path_factory.mktemp('unix') / 'echo server.sock'
+    httpd = UnixEchoServer(str(path), EchoHandler)
+    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f'http+unix://{quote(str(path), safe="")}/'
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def sessions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Isolate managed sessions of every test."""
+    monkeypatch.setattr(SessionManager, '_sessions', {})
+
+
+@pytest.fixture(autouse=True)
+def hooks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Isolate subscribed lifecycle hooks of every test."""
+    monkeypatch.setattr(HookManager, '_hooks', {})
@@ -0,0 +1,121 @@
+"""Tests of HTTP exchange capture for failed tests."""
+
+import json
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_loco_http.actions import request
+from pytest_loco_http.capture import REDACTED, BodyStore, HttpCapture
+from pytest_loco_http.hooks import HookEvent, HookManager
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CAPTURE_SIZE = 2
+REQUEST_COUNT = 5
+AUTHORIZATION = 'Bearer secret-token'
+
+CAPTURED_TESTS = '''
+from pytest_loco_http.actions import request
+
+def test_failing():
+    request('GET', {{'url': '{server}cookies/set?session=secret', 'headers': {{'authorization': '{authorization}'}}}})
+    assert False
+
+def test_passing():
+    request('GET', {{'url': '{server}echo'}})
+'''
+
+
+def test_body_references(tmp_path: 'Path') -> None:
+    """A stored body is removed once its last reference is released."""
+    store = BodyStore(tmp_path)
+    digest = store.put(b'body')
+
+    assert store.put(b'body') == digest
+    assert list(tmp_path.iterdir()) == [tmp_path / digest]
+
+    store.release(digest)
+    assert store.get(digest) == b'body'
+
+    store.release(digest)
+    store.release(None)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_store_is_bounded(server: str, tmp_path: 'Path') -> None:
+    """Bodies of evicted and discarded exchanges are removed from the store."""
+    capture = HttpCapture(CAPTURE_SIZE, tmp_path)
+    HookManager.subscribe(HookEvent.PRE_SEND, capture.record)
+    HookManager.subscribe(HookEvent.POST_RECEIVE, capture.record)
+
+    for index in range(REQUEST_COUNT):
+        request('POST', {'url': f'{server}echo', 'data': f'body {index}'})
+
+    # Request and response bodies of the buffered exchanges only.
+    assert len(capture.records) == CAPTURE_SIZE
+    assert len(list(capture.store.root.iterdir())) == CAPTURE_SIZE * 2
+
+    capture.clear()
+    assert list(capture.store.root.iterdir()) == []
+
+    capture.pytest_unconfigure()
+    assert not capture.store.root.exists()
+
+
+@pytest.mark.parametrize(('options', 'redacted'), [
+    ((), True),
+    (('--http-capture-secrets',), False),
+])
+def test_failed_test_capture(pytester: pytest.Pytester, server: str, options: tuple[str, ...], redacted: bool) -> None:
+    """A HAR file is written for a failed test only, with credentials redacted by default."""
+    pytester.makepyfile(test_captured=CAPTURED_TESTS.format(server=server, authorization=AUTHORIZATION))
+    directory = pytester.path / 'captures'
+
+    result = pytester.runpytest_subprocess(
+        '-p', 'no:cacheprovider',
+        '--http-capture=2',
+        f'--http-capture-dir={directory}',
+        *options,
+    )
+
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(['*Captured HTTP exchanges*'])
+    assert [path.name for path in directory.iterdir()] == ['test_captured.py_test_failing.har']
+
+    [entry] = json.loads((directory / 'test_captured.py_test_failing.har').read_text())['log']['entries']
+    request_headers = {header['name'].lower(): header['value'] for header in entry['request']['headers']}
+    response_headers = {header['name'].lower(): header['value'] for header in entry['response']['headers']}
+
+    assert entry['response']['status'] == HTTPStatus.OK
+    assert request_headers['authorization'] == (REDACTED if redacted else AUTHORIZATION)
+    assert response_headers['set-cookie'] == (REDACTED if redacted else 'session=secret; Path=/')
+
+
+def test_har_entries(server: str, tmp_path: 'Path') -> None:
+    """Buffered exchanges are converted into HAR entries."""
+    capture = HttpCapture(CAPTURE_SIZE, tmp_path)
+    HookManager.subscribe(HookEvent.PRE_SEND, capture.record)
+    HookManager.subscribe(HookEvent.POST_RECEIVE, capture.record)
+
+    request('POST', {'url': f'{server}echo?page=1', 'data': 'data', 'headers': {'content-type': 'text/plain'}})
+    request('GET', {'url': f'{server}status/404'})
+
+    path = capture.write('tests/test_capture.py::test[case]')
+    assert path == tmp_path / 'tests_test_capture.py_test_case.har'
+
+    posted, missing = json.loads(path.read_text())['log']['entries']
+    assert posted['request']['method'] == 'POST'
+    assert posted['request']['httpVersion'] == 'HTTP/1.1'
+    assert posted['request']['queryString'] == [{'name': 'page', 'value': '1'}]
+    assert posted['request']['postData'] == {'mimeType': 'text/plain', 'text': 'data'}
+    assert posted['response']['statusText'] == 'OK'
+    assert posted['response']['content']['mimeType'] == 'application/json'
+    assert json.loads(posted['response']['content']['text'])['method'] == 'POST'
+    assert posted['time'] >= 0
+
+    assert 'postData' not in missing['request']
+    assert missing['response']['status'] == HTTPStatus.NOT_FOUND
+    assert missing['response']['statusText'] == 'Not Found'
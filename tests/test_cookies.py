@@ -0,0 +1,57 @@
+"""Tests of cookie model conversion."""
+
+import pytest
+from requests.cookies import create_cookie
+
+from pytest_loco_http.schema import CookieModel
+
+EXPIRES = 4102444800
+
+
+@pytest.fixture(autouse=True)
+def cache() -> None:
+    """Start every test with an empty cookie model cache."""
+    CookieModel.from_fields.cache_clear()
+
+
+def test_same_cookie_model() -> None:
+    """Cookies with identical attributes share a single model."""
+    first = CookieModel.from_cookiejar_cookie(create_cookie('name', 'value', expires=EXPIRES))
+    second = CookieModel.from_cookiejar_cookie(create_cookie('name', 'value', expires=EXPIRES))
+
+    assert second is first
+
+
+@pytest.mark.parametrize('changes', [
+    pytest.param({'value': 'changed'}, id='value'),
+    pytest.param({'expires': EXPIRES + 1}, id='expires'),
+    pytest.param({'expires': None}, id='session'),
+    pytest.param({'domain': 'example.com'}, id='domain'),
+    pytest.param({'secure': True}, id='secure'),
+    pytest.param({'rest': {'SameSite': 'Strict'}}, id='rest'),
+])
+def test_changed_cookie_model(changes: dict[str, object]) -> None:
+    """A changed cookie attribute produces a new model."""
+    attributes = {'value': 'value', 'expires': EXPIRES}
+    original = CookieModel.from_cookiejar_cookie(create_cookie('name', **attributes))
+    changed = CookieModel.from_cookiejar_cookie(create_cookie('name', **{**attributes, **changes}))
+
+    assert changed is not original
+    assert changed != original
+
+
+def test_changed_cookie_value() -> None:
+    """A cookie updated in place is converted with its new value and expiry."""
+    cookie = create_cookie('name', 'value', expires=EXPIRES)
+    original = CookieModel.from_cookiejar_cookie(cookie)
+
+    cookie.value = 'changed'
+    cookie.expires = EXPIRES + 1
+    changed = CookieModel.from_cookiejar_cookie(cookie)
+
+    assert original.value is not None
+    assert original.value.get_secret_value() == 'value'
+    assert changed.value is not None
+    assert changed.value.get_secret_value() == 'changed'
+    assert changed.expires is not None
+    assert changed.expires.timestamp() == EXPIRES + 1
@@ -0,0 +1,85 @@
+"""Tests of request body compression and accepted response encodings."""
+
+import base64
+import gzip
+import json
+import zlib
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pytest_loco_http.actions import request
+from pytest_loco_http.encoding import accept_encoding, compress
+
+if TYPE_CHECKING:
+    from pytest_loco_http.encoding import Compression
+
+
+def echo(method: str, server: str, **params: Any) -> dict[str, Any]:
+    """Send a request to the echo endpoint and parse the echoed request."""
+    result = request(method, {'url': f'{server}echo', **params})
+
+    return json.loads(result['text'])
+
+
+def test_default_accept_encoding(server: str) -> None:
+    """Sessions do not accept content codings unless configured."""
+    echoed = echo('GET', server)
+
+    assert echoed['headers']['accept-encoding'] == 'identity'
+
+
+def test_accept_encoding(server: str) -> None:
+    """Accepted encodings apply to subsequent requests of the session."""
+    echo('GET', server, acceptEncoding=['gzip', 'deflate'])
+    echoed = echo('GET', server)
+
+    assert echoed['headers']['accept-encoding'] == 'gzip, deflate'
+
+
+def test_compressed_request(server: str) -> None:
+    """A compressed request body is sent gzip-encoded."""
+    echoed = echo('POST', server, data='Hello, World!', compress='gzip')
+
+    assert echoed['headers']['content-encoding'] == 'gzip'
+    assert gzip.decompress(base64.b64decode(echoed['body'])) == b'Hello, World!'
+
+
+def test_compressed_response(server: str) -> None:
+    """A gzip-encoded response is decoded and its transferred size is reported."""
+    result = request('GET', {'url': f'{server}gzip', 'acceptEncoding': 'gzip'})
+
+    assert json.loads(result['text'])['headers']['accept-encoding'] == 'gzip'
+    assert result['size'] == len(result['text'].encode())
+    assert 0 < result['raw_size'] < result['size']
+
+
+def test_empty_response_size(server: str) -> None:
+    """A response without a body is reported as transferring no bytes."""
+    result = request('HEAD', {'url': f'{server}echo'})
+
+    assert int(result['headers']['content-length']) > 0
+    assert result['raw_size'] == 0
+
+
+@pytest.mark.parametrize('encoding', ['gzip', 'deflate'])
+def test_compress(encoding: 'Compression') -> None:
+    """Request bodies are compressed with the content coding."""
+    decompress = {'gzip': gzip.decompress, 'deflate': zlib.decompress}[encoding]
+
+    assert decompress(compress('Hello, World!', encoding)) == b'Hello, World!'
+
+
+def test_unavailable_compression() -> None:
+    """Unknown content codings are rejected."""
+    with pytest.raises(ValueError, match='is not available'):
+        compress(b'data', 'br')  # type: ignore[arg-type]
+
+
+def test_accept_encoding_value() -> None:
+    """Accepted encodings are validated against available decoders."""
+    assert accept_encoding('gzip, deflate;q=0.5') == 'gzip, deflate;q=0.5'
+    assert accept_encoding(['identity', '*']) == 'identity, *'
+
+    with pytest.raises(ValueError, match='cannot be decoded'):
+        accept_encoding(['gzip', 'unknown'])
@@ -0,0 +1,95 @@
+"""Tests of request lifecycle hooks."""
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from pytest_loco_http.actions import request
+from pytest_loco_http.hooks import HookEvent, HookManager
+
+if TYPE_CHECKING:
+    from pytest_loco_http.hooks import Hook
+
+type Calls = list[tuple[str, HookEvent, dict[str, Any]]]
+
+
+def recorder(calls: 'Calls', name: str) -> 'Hook':
+    """Create a hook appending its calls to a list."""
+    def hook(event: HookEvent, payload: dict[str, Any]) -> None:
+        calls.append((name, event, payload))
+
+    return hook
+
+
+def test_hooks_called_in_order() -> None:
+    """Hooks are called in order of subscription with the same payload."""
+    calls: Calls = []
+    first, second = recorder(calls, 'first'), recorder(calls, 'second')
+    HookManager.subscribe(HookEvent.PRE_SEND, first)
+    HookManager.subscribe(HookEvent.PRE_SEND, second)
+
+    HookManager.emit(HookEvent.PRE_SEND, request='request')
+
+    assert [(name, event) for name, event, _ in calls] == [
+        ('first', HookEvent.PRE_SEND),
+        ('second', HookEvent.PRE_SEND),
+    ]
+    assert calls[0][2] is calls[1][2]
+    assert calls[0][2]['request'] == 'request'
+    assert isinstance(calls[0][2]['timestamp'], int)
+
+
+def test_subscribe_once() -> None:
+    """A hook subscribed twice is called once."""
+    calls: Calls = []
+    hook = recorder(calls, 'hook')
+    HookManager.subscribe(HookEvent.PRE_SEND, hook)
+    HookManager.subscribe(HookEvent.PRE_SEND, hook)
+
+    HookManager.emit(HookEvent.PRE_SEND)
+
+    assert len(calls) == 1
+
+
+def test_unsubscribe() -> None:
+    """An unsubscribed hook is not called; unknown hooks are ignored."""
+    calls: Calls = []
+    hook = recorder(calls, 'hook')
+    HookManager.subscribe(HookEvent.PRE_SEND, hook)
+
+    HookManager.unsubscribe(HookEvent.PRE_SEND, hook)
+    HookManager.unsubscribe(HookEvent.POST_RECEIVE, hook)
+    HookManager.emit(HookEvent.PRE_SEND)
+
+    assert calls == []
+
+
+def test_explicit_timestamp() -> None:
+    """An explicit timestamp of the payload is kept."""
+    calls: Calls = []
+    HookManager.subscribe(HookEvent.PRE_SEND, recorder(calls, 'hook'))
+
+    HookManager.emit(HookEvent.PRE_SEND, timestamp=1)
+
+    assert calls[0][2]['timestamp'] == 1
+
+
+def test_exchange_events(server: str) -> None:
+    """A request emits every lifecycle event in order with its payload."""
+    calls: Calls = []
+    for event in HookEvent:
+        HookManager.subscribe(event, recorder(calls, event))
+
+    request('GET', {'url': f'{server}echo'})
+
+    assert [event for _, event, _ in calls] == list(HookEvent)
+
+    payloads = {event: payload for _, event, payload in calls}
+    assert payloads[HookEvent.PRE_SEND]['request'].url == f'{server}echo'
+    assert payloads[HookEvent.POST_CONNECT]['host'] == '127.0.0.1'
+    assert payloads[HookEvent.POST_CONNECT]['started'] <= payloads[HookEvent.POST_CONNECT]['timestamp']
+    assert payloads[HookEvent.FIRST_BYTE]['response'] is payloads[HookEvent.POST_RECEIVE]['response']
+    assert payloads[HookEvent.POST_RECEIVE]['size'] > 0
+    assert payloads[HookEvent.POST_MODEL_BUILD]['model'].status == HTTPStatus.OK
+
+    timestamps = [payload['timestamp'] for _, _, payload in calls]
+    assert timestamps == sorted(timestamps)
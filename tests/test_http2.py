@@ -0,0 +1,199 @@
+"""Tests of the HTTP/2 engine.
+
+The engine is tested against a local HTTP/2 server serving
+cleartext connections with prior knowledge (h2c) and TLS
+connections negotiating HTTP/2 via ALPN.
+"""
+
+import json
+import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from socketserver import BaseRequestHandler, ThreadingTCPServer
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import ConnectionTerminated, RequestReceived, StreamEnded
+
+from pytest_loco_http.actions import request
+from pytest_loco_http.http2 import HTTP2Adapter
+from pytest_loco_http.sessions import SessionManager
+
+if TYPE_CHECKING:
+    import socket
+    from collections.abc import Iterator
+
+CERTIFICATE = Path(__file__).with_name('localhost.pem')
+PRIVATE_KEY = Path(__file__).with_name('localhost.key')
+
+REQUEST_COUNT = 3
+CONCURRENT_COUNT = 16
+
+
+class H2Handler(BaseRequestHandler):
+    """Connection handler of the local HTTP/2 server.
+
+    Every request is answered with its pseudo-headers as JSON
+    and a host-only cookie.
+    """
+
+    server: 'H2Server'
+
+    def handle(self) -> None:
+        """Serve HTTP/2 streams of a connection."""
+        self.server.connections += 1
+
+        connection = H2Connection(H2Configuration(client_side=False, header_encoding='utf-8'))
+        connection.initiate_connection()
+        self.request.sendall(connection.data_to_send())
+
+        headers: dict[int, dict[str, str]] = {}
+        while data := self.request.recv(65535):
+            for event in connection.receive_data(data):
+                if isinstance(event, RequestReceived):
+                    headers[event.stream_id] = dict(event.headers)
+                elif isinstance(event, StreamEnded):
+                    self.respond(connection, event.stream_id, headers.pop(event.stream_id))
+                elif isinstance(event, ConnectionTerminated):
+                    return
+            self.request.sendall(connection.data_to_send())
+
+    @staticmethod
+    def respond(connection: H2Connection, stream_id: int, headers: dict[str, str]) -> None:
+        """Answer a request stream."""
+        content = json.dumps({
+            'method': headers[':method'],
+            'path': headers[':path'],
+            'stream': stream_id,
+        }).encode()
+
+        connection.send_headers(stream_id, [
+            (':status', str(HTTPStatus.OK)),
+            ('content-type', 'application/json'),
+            ('content-length', str(len(content))),
+            ('set-cookie', 'protocol=h2; Path=/'),
+        ])
+        connection.send_data(stream_id, content, end_stream=True)
+
+
+class H2Server(ThreadingTCPServer):
+    """Local HTTP/2 server, optionally over TLS."""
+
+    daemon_threads = True
+
+    def __init__(self, context: ssl.SSLContext | None = None) -> None:
+        """Initialize the server on a free local port.
+
+        Args:
+            context: Server SSL context, or None for cleartext h2c.
+        """
+        super().__init__(('127.0.0.1', 0), H2Handler)
+        self.context = context
+        self.connections = 0
+
+    def get_request(self) -> tuple['socket.socket', Any]:
+        """Accept a connection, performing the TLS handshake if enabled."""
+        sock, address = super().get_request()
+        if self.context is not None:
+            sock = self.context.wrap_socket(sock, server_side=True)
+
+        return sock, address
+
+
+def serve(context: ssl.SSLContext | None, scheme: str) -> 'Iterator[tuple[str, H2Server]]':
+    """Run a local HTTP/2 server in a background thread."""
+    httpd = H2Server(context)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f'{scheme}://127.0.0.1:{httpd.server_address[1]}/', httpd
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture
+def h2c_server() -> 'Iterator[tuple[str, H2Server]]':
+    """Run a local cleartext HTTP/2 server with prior knowledge."""
+    yield from serve(None, 'http')
+
+
+@pytest.fixture
+def h2_server() -> 'Iterator[tuple[str, H2Server]]':
+    """Run a local HTTP/2 server negotiating the protocol via ALPN."""
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(CERTIFICATE, PRIVATE_KEY)
+    context.set_alpn_protocols(['h2'])
+
+    yield from serve(context, 'https')
+
+
+def test_http2_engine(h2_server: tuple[str, 'H2Server']) -> None:
+    """The http2 engine negotiates HTTP/2 over TLS."""
+    url, _ = h2_server
+    result = request('GET', {'url': f'{url}echo', 'engine': 'http2', 'verify': str(CERTIFICATE)})
+
+    assert result['status'] == HTTPStatus.OK
+    assert result['version'] == 'HTTP/2'
+    assert json.loads(result['text'])['path'] == '/echo'
+    assert result['cookies'][0]['name'] == 'protocol'
+
+
+def test_h2c_engine(h2c_server: tuple[str, 'H2Server']) -> None:
+    """The h2c engine uses HTTP/2 with prior knowledge over cleartext."""
+    url, httpd = h2c_server
+    results = [
+        request('POST', {'url': f'{url}echo', 'engine': 'h2c', 'data': 'data'})
+        for _ in range(REQUEST_COUNT)
+    ]
+
+    assert [result['version'] for result in results] == ['HTTP/2'] * REQUEST_COUNT
+    assert [json.loads(result['text'])['method'] for result in results] == ['POST'] * REQUEST_COUNT
+    assert httpd.connections == 1
+
+
+def test_h2c_multiplexing(h2c_server: tuple[str, 'H2Server']) -> None:
+    """Concurrent requests of a session are multiplexed over one connection."""
+    url, httpd = h2c_server
+    request('GET', {'url': f'{url}echo', 'engine': 'h2c'})
+
+    with ThreadPoolExecutor(CONCURRENT_COUNT) as executor:
+        results = list(executor.map(
+            lambda index: request('GET', {'url': f'{url}echo?index={index}'}),
+            range(CONCURRENT_COUNT),
+        ))
+
+    echoed = [json.loads(result['text']) for result in results]
+    assert [item['path'] for item in echoed] == [f'/echo?index={index}' for index in range(CONCURRENT_COUNT)]
+    assert len({item['stream'] for item in echoed}) == CONCURRENT_COUNT
+    assert httpd.connections == 1
+
+
+def test_http2_engine_over_cleartext(server: str) -> None:
+    """The http2 engine falls back to HTTP/1.1 for cleartext URLs."""
+    result = request('GET', {'url': f'{server}echo', 'engine': 'http2'})
+
+    assert result['status'] == HTTPStatus.OK
+    assert result['version'] == 'HTTP/1.1'
+
+
+def test_set_engine() -> None:
+    """Switching the engine mounts the matching adapters once."""
+    session = SessionManager.initialize()
+
+    SessionManager.set_engine(session, 'h2c')
+    adapter = session.get_adapter('https://')
+    assert isinstance(adapter, HTTP2Adapter)
+    assert adapter.engine == 'h2c'
+    assert session.get_adapter('http://') is adapter
+
+    SessionManager.set_engine(session, 'h2c')
+    assert session.get_adapter('https://') is adapter
+
+    SessionManager.set_engine(session, 'http1')
+    assert not isinstance(session.get_adapter('https://'), HTTP2Adapter)
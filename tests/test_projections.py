@@ -0,0 +1,66 @@
+"""Tests of response field projection."""
+
+from http import HTTPStatus
+
+import pytest
+from pydantic import ValidationError
+
+from pytest_loco_http.actions import request
+from pytest_loco_http.schema import ProjectionModel
+from pytest_loco_http.schema.projections import ALL_ITEMS, project
+
+
+def test_include_tree() -> None:
+    """Paths are merged into a projection tree."""
+    projection = ProjectionModel.model_validate([
+        'status',
+        'headers.content-type',
+        'history.*.status',
+        'json.items.0',
+        'json.items',
+        'json.items.1',
+    ])
+
+    assert projection.include == {
+        'status': True,
+        'headers': {'content-type': True},
+        'history': {ALL_ITEMS: {'status': True}},
+        'json': {'items': True},
+    }
+
+
+def test_invalid_path() -> None:
+    """Paths with empty segments are rejected."""
+    with pytest.raises(ValidationError, match='Invalid field path'):
+        ProjectionModel.model_validate(['headers..content-type'])
+
+
+def test_project() -> None:
+    """Only the selected parts of a value are kept."""
+    value = {'items': [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}], '1': 'key', 'total': 2}
+
+    assert project(value, {'items': {ALL_ITEMS: {'id': True}}}) == {'items': [{'id': 1}, {'id': 2}]}
+    assert project(value, {'items': {-1: True, 5: True}}) == {'items': [{'id': 2, 'name': 'b'}]}
+    assert project(value, {1: True, 'missing': True}) == {'1': 'key'}
+    assert project(value, {'total': {'nested': True}}) == {'total': 2}
+
+
+def test_selected_fields(server: str) -> None:
+    """Only the selected response fields are returned."""
+    result = request('GET', {
+        'url': f'{server}echo',
+        'select': ['status', 'headers.content-type', 'json.method'],
+    })
+
+    assert result == {
+        'status': HTTPStatus.OK,
+        'headers': {'content-type': 'application/json'},
+        'json': {'method': 'GET'},
+    }
+
+
+def test_selected_json_of_text(server: str) -> None:
+    """The selected JSON field of a non-JSON response is empty."""
+    result = request('GET', {'url': f'{server}events?count=1', 'select': ['json']})
+
+    assert result == {'json': None}
@@ -0,0 +1,34 @@
+"""Tests of serialized responses."""
+
+import json
+from http import HTTPStatus
+
+from pytest_loco_http.actions import request
+
+REDIRECT_COUNT = 3
+
+
+def test_redirect_history(server: str) -> None:
+    """Every followed redirect is listed in the history, without its own history."""
+    result = request('GET', {'url': f'{server}redirect/{REDIRECT_COUNT}'})
+
+    assert result['status'] == HTTPStatus.OK
+    assert json.loads(result['text'])['path'] == '/echo'
+
+    history = result['history']
+    assert [hop['status'] for hop in history] == [HTTPStatus.FOUND] * REDIRECT_COUNT
+    assert [hop['headers']['location'] for hop in history] == ['/redirect/2', '/redirect/1', '/echo']
+    assert all(not hop['history'] for hop in history)
+
+
+def test_selected_redirect_history(server: str) -> None:
+    """Selected fields of the redirect history are built for every hop."""
+    result = request('GET', {
+        'url': f'{server}redirect/{REDIRECT_COUNT}',
+        'select': ['status', 'history.*.status'],
+    })
+
+    assert result == {
+        'status': HTTPStatus.OK,
+        'history': [{'status': HTTPStatus.FOUND}] * REDIRECT_COUNT,
+    }
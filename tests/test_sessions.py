@@ -0,0 +1,175 @@
+"""Tests of session state export and restore."""
+
+import json
+import subprocess
+import sys
+import time
+from http.cookiejar import Cookie
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from requests import Session
+from requests.cookies import create_cookie, get_cookie_header
+from requests.models import PreparedRequest
+
+from pytest_loco_http.actions import share
+from pytest_loco_http.schema import SessionStateModel
+from pytest_loco_http.sessions import SessionManager
+from pytest_loco_http.storage import RUN_ENV, STORE_ENV, SessionStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+RESTORE_SCRIPT = '''
+import json
+from pytest_loco_http.actions import restore
+from pytest_loco_http.sessions import SessionManager
+
+result = restore({'session': 'shared'})
+session = SessionManager.get_session('shared')
+print(json.dumps({
+    'restored': result['restored'],
+    'cookie': session.cookies.get('sid', domain='app.example'),
+    'header': session.headers.get('x-tenant'),
+}))
+'''
+
+
+def make_cookie(domain: str, *, domain_specified: bool = False, path: str = '/api') -> Cookie:
+    """Create a cookie as the cookie jar stores one set by a response."""
+    return Cookie(
+        version=0,
+        name='sid',
+        value='secret',
+        port=None,
+        port_specified=False,
+        domain=domain,
+        domain_specified=domain_specified,
+        domain_initial_dot=domain.startswith('.'),
+        path=path,
+        path_specified=False,
+        secure=False,
+        expires=None,
+        discard=True,
+        comment=None,
+        comment_url=None,
+        rest={},
+    )
+
+
+def cookie_header(session: Session, url: str) -> str | None:
+    """Get the Cookie header the session sends to a URL."""
+    request = PreparedRequest()
+    request.prepare(method='GET', url=url)
+
+    return get_cookie_header(session.cookies, request)
+
+
+def restore(session: Session) -> Session:
+    """Round-trip the state of a session through its stored form."""
+    state = SessionStateModel.from_session('default', session)
+    restored = Session()
+    SessionStateModel.model_validate_json(state.model_dump_json()).apply(restored)
+
+    return restored
+
+
+@pytest.mark.parametrize(('url', 'expected'), [
+    ('http://app.example/api/users', 'sid=secret'),
+    ('http://evil.example/api/users', None),
+    ('http://app.example/other', None),
+])
+def test_host_only_cookie_scope(url: str, expected: str | None) -> None:
+    """A restored host-only cookie is sent to its host and path only."""
+    session = Session()
+    session.cookies.set_cookie(make_cookie('app.example'))
+
+    assert cookie_header(restore(session), url) == expected
+
+
+@pytest.mark.parametrize('domain', ['app.example', '.app.example'])
+@pytest.mark.parametrize('url', [
+    'http://app.example/api/users',
+    'http://sub.app.example/api/users',
+    'https://evil.example/',
+])
+def test_restored_cookie_scope(domain: str, url: str) -> None:
+    """A restored cookie is sent wherever the original one is."""
+    session = Session()
+    session.cookies.set_cookie(make_cookie(domain, domain_specified=domain.startswith('.')))
+
+    assert cookie_header(restore(session), url) == cookie_header(session, url)
+
+
+@pytest.mark.parametrize(('url', 'expected'), [
+    ('http://app.example/api/users', 'sid=secret'),
+    ('http://sub.app.example/api/users', 'sid=secret'),
+    ('http://evil.example/api/users', None),
+])
+def test_domain_cookie_scope(url: str, expected: str | None) -> None:
+    """A restored domain cookie is sent to the domain and its subdomains."""
+    session = Session()
+    session.cookies.set_cookie(make_cookie('.app.example', domain_specified=True))
+
+    assert cookie_header(restore(session), url) == expected
+
+
+def test_public_cookie_domain() -> None:
+    """The public cookie domain is only set by domain cookies."""
+    session = Session()
+    session.cookies.set_cookie(make_cookie('app.example'))
+
+    cookie, = SessionStateModel.from_session('default', session).cookies
+
+    assert cookie.domain is None
+    assert cookie.scope_domain == 'app.example'
+
+
+@pytest.fixture
+def store(tmp_path: 'Path', monkeypatch: pytest.MonkeyPatch) -> SessionStore:
+    """Isolate the shared session store and the managed sessions."""
+    monkeypatch.setenv(STORE_ENV, str(tmp_path))
+    monkeypatch.setenv(RUN_ENV, 'sessions')
+    monkeypatch.setattr(SessionManager, '_store', None)
+
+    return SessionManager.get_store()
+
+
+def restore_in_subprocess() -> dict[str, Any]:
+    """Restore the shared session in a new process."""
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, '-c', RESTORE_SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    return json.loads(output)
+
+
+@pytest.mark.usefixtures('store')
+def test_state_round_trip() -> None:
+    """A state exported by one process is restored by another."""
+    session = SessionManager.get_session('shared')
+    session.headers['x-tenant'] = 'acme'
+    session.cookies.set_cookie(create_cookie('sid', 'secret', domain='app.example', expires=int(time.time()) + 3600))
+
+    share({'session': 'shared'})
+
+    assert restore_in_subprocess() == {'restored': True, 'cookie': 'secret', 'header': 'acme'}
+
+
+def test_expired_state_is_ignored(store: SessionStore) -> None:
+    """An expired state is not restored."""
+    expired = create_cookie('sid', 'secret', domain='app.example', expires=int(time.time()) - 60)
+    session = Session()
+    session.cookies.set_cookie(expired)
+    store.save(SessionStateModel.from_session('shared', session))
+
+    assert restore_in_subprocess() == {'restored': False, 'cookie': None, 'header': None}
+
+
+@pytest.mark.usefixtures('store')
+def test_missing_state_is_reported() -> None:
+    """Restoring a session without a stored state reports it."""
+    assert restore_in_subprocess()['restored'] is False
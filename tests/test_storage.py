@@ -0,0 +1,58 @@
+"""Tests of the shared session state store."""
+
+import stat
+from typing import TYPE_CHECKING
+
+from pytest_loco_http.schema import SessionStateModel
+from pytest_loco_http.storage import DIRECTORY_MODE, FILE_MODE, SessionStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def mode(path: 'Path') -> int:
+    """Get permission bits of a path."""
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+def test_store_is_private(tmp_path: 'Path') -> None:
+    """Stored states are only accessible by the owner."""
+    store = SessionStore(tmp_path / 'store' / 'run')
+    store.save(SessionStateModel(name='default'))
+
+    assert mode(store.root.parent) == DIRECTORY_MODE
+    assert mode(store.root) == DIRECTORY_MODE
+    assert mode(store.path('default')) == FILE_MODE
+
+
+def test_store_clear(tmp_path: 'Path') -> None:
+    """Clearing the store removes the run directory."""
+    store = SessionStore(tmp_path / 'run')
+    store.save(SessionStateModel(name='default'))
+
+    store.clear()
+
+    assert not store.root.exists()
+    assert store.load('default') is None
+
+
+def test_store_removed_after_session(pytester: 'pytest.Pytester', monkeypatch: 'pytest.MonkeyPatch') -> None:
+    """The pytest plugin removes the stored states of its run."""
+    monkeypatch.delenv('LOCO_HTTP_SESSION_RUN', raising=False)
+    monkeypatch.setenv('LOCO_HTTP_SESSION_STORE', str(pytester.path / 'store'))
+    pytester.makepyfile('''
+        from pytest_loco_http.schema import SessionStateModel
+        from pytest_loco_http.storage import DIRECTORY_MODE, FILE_MODE, SessionStore
+
+        def test_export():
+            store = SessionStore()
+            store.save(SessionStateModel(name='default'))
+            assert store.load('default') is not None
+    ''')
+
+    result = pytester.runpytest_subprocess('-p', 'no:cacheprovider')
+
+    result.assert_outcomes(passed=1)
+    assert list((pytester.path / 'store').iterdir()) == []
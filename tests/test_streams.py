@@ -0,0 +1,137 @@
+"""Tests of streaming response consumption."""
+
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_loco_http.actions import stream, stream_parameters
+from pytest_loco_http.streams import consume, iter_lines, iter_sse
+
+if TYPE_CHECKING:
+    from requests import Response
+
+    from pytest_loco_http.streams import StreamFormat
+
+SILENCE = 5
+DURATION = 1
+EVENT_COUNT = 3
+
+
+def chunked(*chunks: bytes) -> 'Response':
+    """Create a stand-in streaming response receiving the given chunks."""
+    received = iter(chunks)
+    raw = SimpleNamespace(read1=lambda **_: next(received, b''))
+
+    return SimpleNamespace(  # type: ignore[return-value]
+        raw=raw,
+        encoding='utf-8',
+        url='http://example.test/',
+        elapsed=timedelta(0),
+        close=lambda: None,
+    )
+
+
+@pytest.mark.parametrize('chunks', [
+    (b'data: a\r\ndata: b\r\n\r\n',),
+    (b'data: a\r', b'\ndata: b\r\n\r\n'),
+    (b'data: a\r', b'\ndata: b\r', b'\n\r', b'\n'),
+    (b'data: a\rdata: b\r', b'\r'),
+    (b'data: a\ndata: b\n', b'\n'),
+])
+def test_lines_across_chunks(chunks: tuple[bytes, ...]) -> None:
+    """Line terminators split across chunks end a single line."""
+    assert list(iter_lines(chunked(*chunks))) == ['data: a', 'data: b', '']
+
+
+def test_trailing_line() -> None:
+    """An unterminated last line is yielded at the end of the stream."""
+    assert list(iter_lines(chunked(b'a\nb'))) == ['a', 'b']
+
+
+def test_event_across_chunks() -> None:
+    """A CRLF split across chunks does not dispatch an event early."""
+    events = list(iter_sse(chunked(b'data: a\r', b'\ndata: b\r\n\r\n')))
+
+    assert events == [{'data': 'a\nb'}]
+
+
+@pytest.mark.parametrize(('fmt', 'data'), [
+    pytest.param('ndjson', [{'index': 0}, {'index': 1}], id='ndjson'),
+    pytest.param('lines', ['{"index": 0}', '', '{"index": 1}'], id='lines'),
+    pytest.param('chunks', [b'{"index": 0}\n\n', b'{"index": 1}\n'], id='chunks'),
+])
+def test_stream_formats(fmt: 'StreamFormat', data: list[object]) -> None:
+    """The body is split into events of the stream format."""
+    events, reason = consume(chunked(b'{"index": 0}\n\n', b'{"index": 1}\n'), fmt)
+
+    assert [event['data'] for event in events] == data
+    assert reason == 'closed'
+
+
+def test_sse_fields() -> None:
+    """SSE fields are parsed and comments and events without data are skipped."""
+    events = list(iter_sse(chunked(
+        b': comment\n',
+        b'event: update\nid: 1\nretry: 100\ndata: a\n\n',
+        b'event: empty\n\n',
+        b'id: 2\0\nretry: soon\ndata: b\n\n',
+    )))
+
+    assert events == [
+        {'event': 'update', 'id': '1', 'retry': 100, 'data': 'a'},
+        {'data': 'b'},
+    ]
+
+
+def test_stream_events(server: str) -> None:
+    """Server-Sent Events are collected until the stream is closed."""
+    result = stream({'url': f'{server}events?count={EVENT_COUNT}', 'timeout': 30})
+
+    assert result['reason'] == 'closed'
+    assert [event['id'] for event in result['events']] == [str(index) for index in range(EVENT_COUNT)]
+    assert result['events'][0]['data'] == '{"index": 0}'
+    assert all(event['elapsed'] >= 0 for event in result['events'])
+
+
+@pytest.mark.parametrize(('params', 'reason'), [
+    pytest.param({'count': 2}, 'count', id='count'),
+    pytest.param({'until': '"index": 1'}, 'match', id='until'),
+])
+def test_stream_stop(server: str, params: dict[str, object], reason: str) -> None:
+    """Consumption stops early on the event count or a matching event."""
+    result = stream({'url': f'{server}events?count={EVENT_COUNT}', 'timeout': 30, **params})
+
+    assert result['reason'] == reason
+    assert [event['id'] for event in result['events']] == ['0', '1']
+
+
+def test_stream_ndjson(server: str) -> None:
+    """A JSON response is consumed as NDJSON lines."""
+    result = stream({'url': f'{server}echo', 'method': 'POST', 'format': 'ndjson', 'timeout': 30})
+
+    [event] = result['events']
+    assert event['data']['method'] == 'POST'
+    assert result['reason'] == 'closed'
+
+
+def test_duration_bounds_silent_stream(server: str) -> None:
+    """The duration stops a silent stream regardless of the timeout."""
+    started = time.monotonic()
+    result = stream({
+        'url': f'{server}silent?seconds={SILENCE}',
+        'duration': DURATION,
+        'timeout': 30,
+    })
+
+    assert result['reason'] == 'timeout'
+    assert result['events'] == []
+    assert time.monotonic() - started < SILENCE
+
+
+def test_stream_parameters() -> None:
+    """Field projection is not accepted by the stream action."""
+    assert 'select' not in stream_parameters.root
+    assert all('include' not in (attribute.aliases or ()) for attribute in stream_parameters.root.values())
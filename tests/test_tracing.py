@@ -0,0 +1,119 @@
+"""Tests of trace span export."""
+
+import json
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pytest_loco_http.actions import request
+from pytest_loco_http.hooks import HookEvent, HookManager
+from pytest_loco_http.tracing import TRACE_ENV, TRACE_FORMAT_ENV, WORKER_ENV, TraceExporter
+from pytest_loco_http.user_agent import LOCO_PLUGIN
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_loco_http.tracing import TraceFormat
+
+SPAN_NAMES = ['HTTP GET', 'connect', 'wait', 'receive', 'build']
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+
+
+def trace(server: str, path: 'Path', fmt: 'TraceFormat') -> dict[str, Any]:
+    """Send a traced request and dump the recorded spans."""
+    exporter = TraceExporter(path, fmt)
+    for event in HookEvent:
+        HookManager.subscribe(event, exporter.record)
+
+    request('GET', {'url': f'{server}echo'})
+
+    return exporter.dump()
+
+
+def test_chrome_trace(server: str, tmp_path: 'Path') -> None:
+    """Spans are dumped as nested Chrome trace complete events."""
+    document = trace(server, tmp_path / 'trace.json', 'chrome')
+
+    assert document['displayTimeUnit'] == 'ms'
+
+    root, *steps = events = document['traceEvents']
+    assert [event['name'] for event in events] == SPAN_NAMES
+    assert all(event['ph'] == 'X' and event['dur'] >= 0 for event in events)
+    assert all(root['ts'] <= step['ts'] <= root['ts'] + root['dur'] for step in steps)
+    assert root['args']['http.request.method'] == 'GET'
+    assert root['args']['url.full'] == f'{server}echo'
+    assert root['args']['http.response.status_code'] == HTTPStatus.OK
+    assert steps[0]['args']['server.address'] == '127.0.0.1'
+
+
+def test_otlp_trace(server: str, tmp_path: 'Path') -> None:
+    """Spans are dumped as an OTLP-JSON trace of a single exchange."""
+    document = trace(server, tmp_path / 'trace.json', 'otlp')
+
+    [resource] = document['resourceSpans']
+    assert {'key': 'service.name', 'value': {'stringValue': LOCO_PLUGIN}} in resource['resource']['attributes']
+
+    [scope] = resource['scopeSpans']
+    root, *steps = spans = scope['spans']
+    assert [span['name'] for span in spans] == SPAN_NAMES
+    assert len({span['traceId'] for span in spans}) == 1
+    assert root['kind'] == SPAN_KIND_CLIENT
+    assert 'parentSpanId' not in root
+    assert all(span['kind'] == SPAN_KIND_INTERNAL for span in steps)
+    assert all(span['parentSpanId'] == root['spanId'] for span in steps)
+    assert all(int(span['startTimeUnixNano']) <= int(span['endTimeUnixNano']) for span in spans)
+    assert {
+        'key': 'http.response.status_code',
+        'value': {'intValue': str(HTTPStatus.OK)},
+    } in root['attributes']
+
+
+def test_write(tmp_path: 'Path') -> None:
+    """The trace file is written with its parent directories."""
+    exporter = TraceExporter(tmp_path / 'traces' / 'trace.json')
+
+    exporter.write()
+
+    assert json.loads(exporter.path.read_text()) == {'traceEvents': [], 'displayTimeUnit': 'ms'}
+
+
+def test_environment(monkeypatch: pytest.MonkeyPatch, tmp_path: 'Path') -> None:
+    """The exporter is configured by environment variables."""
+    monkeypatch.delenv(TRACE_ENV, raising=False)
+    assert TraceExporter.from_environment() is None
+
+    monkeypatch.setenv(TRACE_ENV, str(tmp_path / 'trace.json'))
+    monkeypatch.setenv(TRACE_FORMAT_ENV, 'otlp')
+    monkeypatch.setenv(WORKER_ENV, 'gw1')
+    exporter = TraceExporter.from_environment()
+
+    assert exporter is not None
+    assert exporter.format == 'otlp'
+    assert exporter.path == tmp_path / 'trace.gw1.json'
+
+
+def test_trace_written_after_session(pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The pytest plugin installs the exporter configured by the environment."""
+    monkeypatch.setenv(TRACE_ENV, str(pytester.path / 'trace.json'))
+    monkeypatch.delenv(TRACE_FORMAT_ENV, raising=False)
+    monkeypatch.delenv(WORKER_ENV, raising=False)
+    pytester.makepyfile('def test_nothing(): pass')
+
+    result = pytester.runpytest_subprocess('-p', 'no:cacheprovider')
+
+    result.assert_outcomes(passed=1)
+    assert json.loads((pytester.path / 'trace.json').read_text())['traceEvents'] == []
+
+
+def test_unknown_format(pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+    """An unknown trace format is reported as a usage error."""
+    monkeypatch.setenv(TRACE_ENV, str(pytester.path / 'trace.json'))
+    monkeypatch.setenv(TRACE_FORMAT_ENV, 'jaeger')
+    pytester.makepyfile('def test_nothing(): pass')
+
+    result = pytester.runpytest_subprocess('-p', 'no:cacheprovider')
+
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*Unknown trace format 'jaeger'*"])
@@ -0,0 +1,83 @@
+"""Tests of HTTP over Unix domain sockets."""
+
+import json
+from http import HTTPStatus
+
+import pytest
+import yaml
+from requests.exceptions import InvalidURL
+
+from pytest_loco_http.actions import request
+from pytest_loco_http.adapters import UnixAdapter, socket_path
+from pytest_loco_http.instructions import join, urljoin_constructor
+from pytest_loco_http.schema import UrlModel
+from pytest_loco_http.sessions import SessionManager
+
+SOCKET_URL = 'http+unix://%2Frun%2Fmy%20app.sock/api/'
+
+
+def test_unix_request(unix_server: str) -> None:
+    """Requests to `http+unix` URLs are sent over the socket."""
+    result = request('GET', {'url': f'{unix_server}echo?name=value'})
+
+    assert result['status'] == HTTPStatus.OK
+    assert json.loads(result['text'])['path'] == '/echo?name=value'
+
+    url = result['request']['url']
+    assert url['scheme'] == 'http+unix'
+    assert url['host'] is None
+    assert url['socket'] == socket_path(unix_server)
+    assert url['path'] == '/echo'
+
+
+def test_unix_pools(unix_server: str) -> None:
+    """Connection pools are reused per socket and released on close."""
+    request('GET', {'url': f'{unix_server}echo'})
+    request('GET', {'url': f'{unix_server}echo'})
+
+    adapter = SessionManager.get_session().get_adapter(unix_server)
+    assert isinstance(adapter, UnixAdapter)
+    assert list(adapter.pools) == [socket_path(unix_server)]
+    assert adapter.pools[socket_path(unix_server)].num_connections == 1
+
+    adapter.close()
+    assert adapter.pools == {}
+
+
+def test_unix_proxies(unix_server: str) -> None:
+    """Proxies are rejected for `http+unix` URLs."""
+    session = SessionManager.initialize()
+
+    with pytest.raises(InvalidURL, match='Proxies are not supported'):
+        session.get(f'{unix_server}echo', proxies={'http+unix': 'http://proxy.test:3128'})
+
+
+def test_url_model() -> None:
+    """The socket path of `http+unix` URLs is decoded and the host is omitted."""
+    url = UrlModel.from_value(f'{SOCKET_URL}health?check=1')
+
+    assert url.scheme == 'http+unix'
+    assert url.host is None
+    assert url.socket == '/run/my app.sock'
+    assert url.path == '/api/health'
+    assert url.query == {'check': '1'}
+
+
+@pytest.mark.parametrize(('postfix', 'joined'), [
+    pytest.param('v1/users?page=2', f'{SOCKET_URL}v1/users?page=2', id='relative'),
+    pytest.param('/health', 'http+unix://%2Frun%2Fmy%20app.sock/health', id='root'),
+    pytest.param('https://example.com/health', 'https://example.com/health', id='absolute'),
+    pytest.param('http+unix://%2Frun%2Fother.sock/', 'http+unix://%2Frun%2Fother.sock/', id='other-socket'),
+    pytest.param('//example.com/health', 'http://example.com/health', id='network-path'),
+])
+def test_urljoin(postfix: str, joined: str) -> None:
+    """URL references are resolved against `http+unix` base URLs."""
+    assert join(SOCKET_URL, postfix) == joined
+
+
+def test_urljoin_instruction() -> None:
+    """The `!urljoin` instruction joins `http+unix` base URLs."""
+    node = yaml.ScalarNode('!urljoin', 'baseUrl v1/users')
+    resolver = urljoin_constructor(yaml.SafeLoader(''), node)  # type: ignore[arg-type]
+
+    assert resolver({'baseUrl': SOCKET_URL}) == f'{SOCKET_URL}v1/users'